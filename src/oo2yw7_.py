@@ -8,8 +8,8 @@ Published under the MIT License (https://opensource.org/licenses/mit-license.php
 """
 import sys
 import platform
-from pywriter.converter.yw7_importer import Yw7Importer
-from pywriter.ui.ui_mb import UiMb
+from oo2yw7lib.converter.oo2yw7_importer import Oo2yw7Importer
+from oo2yw7lib.ui.ui_lazy_mb import UiLazyMb
 
 
 def main(sourcePath):
@@ -21,8 +21,8 @@ def main(sourcePath):
     Positional arguments:
         sourcePath -- document to convert. 
     """
-    converter = Yw7Importer()
-    converter.ui = UiMb(f'{_("Export to yw7")} (Python version {platform.python_version()})')
+    converter = Oo2yw7Importer()
+    converter.ui = UiLazyMb(f'{_("Export to yw7")} (Python version {platform.python_version()})')
     kwargs = {'suffix': None}
     converter.run(sourcePath, **kwargs)
 
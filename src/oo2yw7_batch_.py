@@ -0,0 +1,55 @@
+"""Convert odt/ods documents to yw7 without user interaction.
+
+Version @release
+Requires Python 3.6+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import sys
+import json
+import argparse
+from oo2yw7lib.converter.batch_converter import BatchConverter
+
+
+def main(paths, workers=None, recursive=False):
+    """Convert odt/ods documents to yw7.
+
+    - If a yw7 project file exists, update it from the documents belonging to it.
+    - Otherwise, create a new yw7 project.
+
+    Positional arguments:
+        paths -- list of documents or directories to convert.
+
+    Optional arguments:
+        workers -- maximum number of worker processes.
+        recursive -- if True, search directories recursively.
+
+    Return a list of result dictionaries, one per document.
+    """
+    converter = BatchConverter(workers=workers, recursive=recursive)
+    return converter.run(paths)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Convert odt/ods documents to yw7 without user interaction.',
+        epilog='The results are written to stdout in JSON format.')
+    parser.add_argument('paths',
+                        metavar='Path',
+                        nargs='+',
+                        help='odt/ods document, or directory containing odt/ods documents to import.')
+    parser.add_argument('-r', '--recursive',
+                        action='store_true',
+                        help='search directories recursively.')
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        default=None,
+                        help='maximum number of worker processes (default: number of CPUs).')
+    args = parser.parse_args()
+    results = main(args.paths, workers=args.jobs, recursive=args.recursive)
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    for result in results:
+        if result['status'] == 'failed':
+            sys.exit(1)
@@ -0,0 +1,36 @@
+"""Convert odt/ods to yw7, using the conversion server if it is running. 
+
+Version @release
+Requires Python 3.6+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import sys
+import platform
+from pywriter.pywriter_globals import *
+from oo2yw7lib.server.conversion_client import ConversionClient
+from oo2yw7lib.ui.ui_lazy_mb import UiLazyMb
+
+
+def main(sourcePath):
+    """Convert an odt/ods document to yw7.
+    
+    - If the conversion server is running, let it do the conversion.
+    - Otherwise, load the converter and convert in this process.
+    
+    Positional arguments:
+        sourcePath -- document to convert. 
+    """
+    ui = UiLazyMb(f'{_("Export to yw7")} (Python version {platform.python_version()})')
+    if not ConversionClient().convert(sourcePath, ui):
+        from oo2yw7 import main as convert_in_process
+        convert_in_process(sourcePath)
+
+
+if __name__ == '__main__':
+    try:
+        sourcePath = sys.argv[1]
+    except:
+        sourcePath = ''
+    main(sourcePath)
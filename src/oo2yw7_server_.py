@@ -0,0 +1,53 @@
+"""Keep the odt/ods to yw7 converter loaded for fast conversions.
+
+Version @release
+Requires Python 3.6+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import sys
+import argparse
+from pywriter.pywriter_globals import *
+from oo2yw7lib.server.conversion_client import ConversionClient
+from oo2yw7lib.server.conversion_server import ConversionServer
+
+
+def main(idleMinutes=None):
+    """Run the conversion server until it is stopped.
+    
+    Optional arguments:
+        idleMinutes -- stop after this many minutes without requests.
+
+    Raise the "Error" exception if the server is already running.
+    """
+    idleTimeout = None
+    if idleMinutes:
+        idleTimeout = idleMinutes * 60
+    server = ConversionServer(idleTimeout=idleTimeout)
+    server.serve()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Keep the odt/ods to yw7 converter loaded for fast conversions.',
+        epilog='While the server is running, oo2yw7_client.py lets it do the conversions.')
+    parser.add_argument('--idle',
+                        type=float,
+                        default=None,
+                        metavar='MINUTES',
+                        help='stop after MINUTES without requests (default: run until stopped).')
+    parser.add_argument('--stop',
+                        action='store_true',
+                        help='stop the running server.')
+    args = parser.parse_args()
+    if args.stop:
+        if not ConversionClient().stop():
+            sys.exit(f'{_("The conversion server is not running")}.')
+    else:
+        try:
+            main(args.idle)
+        except Error as ex:
+            sys.exit(str(ex))
+        except KeyboardInterrupt:
+            pass
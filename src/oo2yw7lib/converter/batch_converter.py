@@ -0,0 +1,215 @@
+"""Provide a class for converting many odt/ods documents to yw7 at once.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from pywriter.pywriter_globals import *
+from oo2yw7lib.converter.batch_importer import BatchImporter
+
+
+def convert_project(targetPath, sourcePaths):
+    """Convert all documents belonging to a yw7 project, one after another.
+
+    Positional arguments:
+        targetPath -- str: path of the yw7 project.
+        sourcePaths -- list of str: paths of the odt/ods documents.
+
+    Return a list of result dictionaries in the order of sourcePaths.
+
+    Documents are converted strictly sequentially,
+    because each conversion merges into the yw7 file written by the previous one.
+    This is a module-level function, so it can be passed to a process pool.
+    """
+    converter = BatchImporter()
+    results = []
+    for sourcePath in sourcePaths:
+        startTime = perf_counter()
+        success, message, scenesSplit = converter.convert(sourcePath)
+        if not success:
+            status = 'failed'
+        elif converter.newFile:
+            status = 'written'
+        else:
+            status = 'unchanged'
+        results.append(dict(
+            source=sourcePath,
+            target=targetPath,
+            status=status,
+            message=message,
+            scenesSplit=scenesSplit,
+            updated=converter.updatedElements,
+            warnings=list(converter.ui.warnings),
+            timings=dict(convert=perf_counter() - startTime),
+            ))
+    return results
+
+
+class BatchConverter:
+    """Convert odt/ods documents to yw7 without user interaction.
+
+    Public methods:
+        collect_documents(paths) -- Return a list of the document paths to convert.
+        group_documents(sourcePaths) -- Sort documents by their yw7 projects.
+        run(paths) -- Convert documents and return the results.
+
+    Public instance variables:
+        workers -- int: maximum number of worker processes.
+        recursive -- bool: if True, search directories recursively.
+
+    Documents that belong to different projects are converted in parallel.
+    Documents that belong to the same project are converted one after another,
+    so that two conversions never write to the same yw7 file at the same time.
+
+    Directories are only searched for documents to import into existing projects,
+    i.e. documents with a file name suffix such as "_manuscript" or "_scenelist".
+    New projects are only created from documents given explicitly.
+    A document given explicitly that cannot be converted counts as failed,
+    while a document found in a directory is just skipped.
+    """
+
+    def __init__(self, workers=None, recursive=False):
+        """Set the processing options.
+
+        Optional arguments:
+            workers -- int: maximum number of worker processes. Default: number of CPUs.
+            recursive -- bool: if True, search directories recursively.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.recursive = recursive
+
+    def collect_documents(self, paths):
+        """Return a list of the document paths to convert.
+
+        Positional arguments:
+            paths -- iterable of str: document or directory paths.
+
+        Directories are searched for importable odt/ods documents in alphabetical order.
+        Paths are returned in the given order without duplicates.
+        """
+        documents = []
+        for path in paths:
+            if os.path.isdir(path):
+                documents.extend(self._scan_directory(path))
+            else:
+                documents.append(path)
+        sourcePaths = []
+        for document in documents:
+            if not document in sourcePaths:
+                sourcePaths.append(document)
+        return sourcePaths
+
+    def group_documents(self, sourcePaths):
+        """Sort documents by their yw7 projects.
+
+        Positional arguments:
+            sourcePaths -- list of str: document paths.
+
+        Return a tuple:
+            projects -- dict: key = yw7 path, value = list of document paths.
+            rejected -- list of result dictionaries for documents that cannot be converted.
+        """
+        converter = BatchImporter()
+        projects = {}
+        rejected = []
+        for sourcePath in sourcePaths:
+            if not os.path.isfile(sourcePath):
+                rejected.append(self._reject(sourcePath, f'{_("File not found")}: "{norm_path(sourcePath)}".'))
+                continue
+
+            try:
+                targetPath = converter.get_target_path(sourcePath)
+            except Error as ex:
+                rejected.append(self._reject(sourcePath, str(ex)))
+                continue
+
+            projectKey = os.path.normcase(os.path.realpath(targetPath))
+            projects.setdefault(projectKey, (targetPath, []))[1].append(sourcePath)
+        return dict(projects.values()), rejected
+
+    def run(self, paths):
+        """Convert documents and return the results.
+
+        Positional arguments:
+            paths -- iterable of str: document or directory paths.
+
+        Return a list of result dictionaries in the order of the documents.
+        Each result has the following keys:
+            source -- str: document path.
+            target -- str: yw7 project path, or None.
+            status -- str: "written", "unchanged", "failed", or "skipped".
+            message -- str: message of the converter.
+            scenesSplit -- bool: True if new scenes were created during conversion.
+            updated -- dict: numbers of updated project elements by element type.
+            warnings -- list of str: warnings of the converter.
+            timings -- dict: processing times in seconds.
+        """
+        sourcePaths = self.collect_documents(paths)
+        explicitPaths = [path for path in paths if not os.path.isdir(path)]
+        projects, rejected = self.group_documents(sourcePaths)
+        results = {}
+        for result in rejected:
+            if result['source'] in explicitPaths:
+                result['status'] = 'failed'
+            results[result['source']] = result
+        if self.workers > 1 and len(projects) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(projects))) as executor:
+                futures = {}
+                for targetPath in projects:
+                    futures[targetPath] = executor.submit(convert_project, targetPath, projects[targetPath])
+                for targetPath in futures:
+                    try:
+                        projectResults = futures[targetPath].result()
+                    except Exception as ex:
+                        projectResults = self._fail_project(targetPath, projects[targetPath], ex)
+                    for result in projectResults:
+                        results[result['source']] = result
+        else:
+            for targetPath in projects:
+                try:
+                    projectResults = convert_project(targetPath, projects[targetPath])
+                except Exception as ex:
+                    projectResults = self._fail_project(targetPath, projects[targetPath], ex)
+                for result in projectResults:
+                    results[result['source']] = result
+        return [results[sourcePath] for sourcePath in sourcePaths]
+
+    def _fail_project(self, targetPath, sourcePaths, exception):
+        """Return failed result dictionaries for the documents of a project whose conversion raised an exception."""
+        results = []
+        for sourcePath in sourcePaths:
+            result = self._reject(sourcePath, f'{_("Conversion aborted")}: {type(exception).__name__}: {str(exception)}')
+            result['target'] = targetPath
+            result['status'] = 'failed'
+            results.append(result)
+        return results
+
+    def _reject(self, sourcePath, message):
+        """Return the result dictionary for a document that cannot be converted."""
+        return dict(
+            source=sourcePath,
+            target=None,
+            status='skipped',
+            message=message,
+            scenesSplit=False,
+            updated={},
+            warnings=[],
+            timings={},
+            )
+
+    def _scan_directory(self, dirPath):
+        """Return the sorted paths of the importable documents in a directory."""
+        endings = tuple(f'{fileClass.SUFFIX}{fileClass.EXTENSION}' for fileClass in BatchImporter.IMPORT_SOURCE_CLASSES)
+        documents = []
+        for entry in sorted(os.scandir(dirPath), key=lambda entry: entry.name):
+            if entry.is_dir():
+                if self.recursive:
+                    documents.extend(self._scan_directory(entry.path))
+            elif entry.name.endswith(endings):
+                documents.append(entry.path)
+        return documents
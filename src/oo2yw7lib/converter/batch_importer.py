@@ -0,0 +1,92 @@
+"""Provide a converter class for non-interactive import to yw7.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.pywriter_globals import *
+from oo2yw7lib.converter.oo2yw7_importer import Oo2yw7Importer
+from oo2yw7lib.ui.ui_batch import UiBatch
+
+
+class BatchImporter(Oo2yw7Importer):
+    """A converter that keeps track of the files involved in the last conversion.
+
+    Public methods:
+        get_target_path(sourcePath) -- Return the path of the yw7 project a document belongs to.
+        convert(sourcePath) -- Convert a document and return the result.
+
+    Public instance variables:
+        source -- source file object of the last conversion.
+        target -- target file object of the last conversion.
+    """
+
+    def __init__(self):
+        """Use a UI that neither blocks nor prints.
+
+        Extends the superclass constructor.
+        """
+        super().__init__()
+        self.ui = UiBatch()
+        self.source = None
+        self.target = None
+
+    def get_target_path(self, sourcePath):
+        """Return the path of the yw7 project a document belongs to.
+
+        Positional arguments:
+            sourcePath -- str: path of the odt/ods document.
+
+        Use the same factories as the conversion, but do not read any file.
+        Raise the "Error" exception if the document cannot be converted.
+        """
+        kwargs = {'suffix': None}
+        try:
+            source, __ = self.importSourceFactory.make_file_objects(sourcePath, **kwargs)
+        except Error:
+            __, target = self.newProjectFactory.make_file_objects(sourcePath, **kwargs)
+        else:
+            kwargs['suffix'] = source.SUFFIX
+            __, target = self.importTargetFactory.make_file_objects(sourcePath, **kwargs)
+        return target.filePath
+
+    def convert(self, sourcePath):
+        """Convert a document and return the result.
+
+        Positional arguments:
+            sourcePath -- str: path of the odt/ods document.
+
+        Return a tuple:
+            success -- bool: True if a yw7 file was written.
+            message -- str: result message without the error marker.
+            scenesSplit -- bool: True if new scenes were created during conversion.
+        """
+        self.ui.reset()
+        self.source = None
+        self.target = None
+        self.updatedElements = {}
+        self.run(sourcePath, suffix=None)
+        message = self.ui.infoHowText
+        success = not message.startswith('!')
+        if not success:
+            message = message.split('!', maxsplit=1)[1].strip()
+        scenesSplit = self.source is not None and self.source.scenesSplit
+        return success, message, scenesSplit
+
+    def create_yw7(self, source, target):
+        """Remember the file objects, then create a yWriter project.
+
+        Extends the superclass method.
+        """
+        self.source = source
+        self.target = target
+        super().create_yw7(source, target)
+
+    def import_to_yw(self, source, target):
+        """Remember the file objects, then update the yWriter project.
+
+        Extends the superclass method.
+        """
+        self.source = source
+        self.target = target
+        super().import_to_yw(source, target)
@@ -0,0 +1,223 @@
+"""Provide a class for the import cache of a yWriter 7 project.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import json
+import hashlib
+
+
+class ImportCache:
+    """Sidecar file with content hashes of a yWriter 7 project and its imported documents.
+
+    Public methods:
+        read() -- Load the cache file.
+        write() -- Save the cache file.
+        is_up_to_date(sourcePath) -- Return True if importing the document would change nothing.
+        get_dirty_elements(oldDigests, newDigests) -- Return the numbers of changed elements by type.
+        update(sourcePath) -- Store the digests of the document and the project file after an import.
+
+    Public class methods:
+        get_file_digest(filePath) -- Return the content hash of a file.
+        get_novel_digests(novel) -- Return content hashes of all novel elements.
+
+    Public instance variables:
+        filePath -- str: path to the cache file.
+        ywPath -- str: path to the yWriter project file.
+
+    The cache is located next to the project file.
+    Every document entry is tied to the content hash of the project file written by the import,
+    so the entry becomes invalid as soon as the project file is changed otherwise.
+    A missing or corrupt cache is not an error; it just means that nothing can be skipped.
+    """
+    EXTENSION = '.cache'
+    _VERSION = 1
+    _BUFFER_SIZE = 0x100000
+    _ELEMENT_TYPES = (
+        ('chapters', 'srtChapters'),
+        ('scenes', None),
+        ('characters', 'srtCharacters'),
+        ('locations', 'srtLocations'),
+        ('items', 'srtItems'),
+        ('projectNotes', 'srtPrjNotes'),
+        )
+    _DERIVED = ('wordCount', 'letterCount', '_wordCount', '_letterCount', 'languages')
+
+    def __init__(self, ywPath):
+        """Set the path of the cache file.
+
+        Positional arguments:
+            ywPath -- str: path to the yWriter project file.
+        """
+        self.ywPath = ywPath
+        self.filePath = f'{ywPath}{self.EXTENSION}'
+        self._data = self._new_data()
+
+    def read(self):
+        """Load the cache file.
+
+        Start with an empty cache if the file is missing or cannot be read.
+        """
+        try:
+            with open(self.filePath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data['version'] != self._VERSION:
+                raise ValueError
+
+            self._data = data
+        except:
+            self._data = self._new_data()
+
+    def write(self):
+        """Save the cache file.
+
+        The file is written under a temporary name and then moved into place.
+        Failure is ignored, because the cache is optional.
+        """
+        tempPath = f'{self.filePath}.tmp'
+        try:
+            with open(tempPath, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f)
+            os.replace(tempPath, self.filePath)
+        except:
+            try:
+                os.remove(tempPath)
+            except:
+                pass
+
+    def is_up_to_date(self, sourcePath):
+        """Return True if importing the document would change nothing.
+
+        Positional arguments:
+            sourcePath -- str: path to the document to import.
+
+        This is the case if the document has not changed since it was imported last,
+        and the project file has not changed since then.
+        """
+        try:
+            document = self._data['documents'][self._get_key(sourcePath)]
+            if document['project'] != self.get_file_digest(self.ywPath):
+                return False
+
+            return document['digest'] == self.get_file_digest(sourcePath)
+
+        except:
+            return False
+
+    def get_dirty_elements(self, oldDigests, newDigests):
+        """Return the numbers of changed elements by type.
+
+        Positional arguments:
+            oldDigests -- dict: element digests before the import.
+            newDigests -- dict: element digests after the import.
+
+        Return a dictionary: key = element type, value = number of new, changed, or deleted elements.
+        Element types without changes are omitted.
+        """
+        dirtyElements = {}
+        for elementType in newDigests:
+            oldElements = oldDigests.get(elementType, {})
+            newElements = newDigests[elementType]
+            count = 0
+            for elemId in newElements:
+                if oldElements.get(elemId, None) != newElements[elemId]:
+                    count += 1
+            for elemId in oldElements:
+                if not elemId in newElements:
+                    count += 1
+            if count:
+                dirtyElements[elementType] = count
+        return dirtyElements
+
+    def update(self, sourcePath):
+        """Store the digests of the document and the project file after an import.
+
+        Positional arguments:
+            sourcePath -- str: path to the imported document.
+
+        Call this after the project file is written.
+        Raise an OSError exception if a file cannot be read.
+        """
+        self._data['documents'][self._get_key(sourcePath)] = dict(
+            digest=self.get_file_digest(sourcePath),
+            project=self.get_file_digest(self.ywPath),
+            )
+
+    @classmethod
+    def get_file_digest(cls, filePath):
+        """Return the content hash of a file.
+
+        Positional arguments:
+            filePath -- str: path to the file.
+        """
+        digest = hashlib.sha256()
+        with open(filePath, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls._BUFFER_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def get_novel_digests(cls, novel):
+        """Return content hashes of all novel elements.
+
+        Positional arguments:
+            novel -- Novel instance.
+
+        Return a dictionary: key = element type, value = dictionary of element digests by ID.
+        The project's own data has the element type "project" and an empty ID.
+        An element's position in the sort order is part of its digest.
+        Values derived from the scene contents are not.
+        """
+        elementDicts = set()
+        digests = {}
+        for elementType, sortListName in cls._ELEMENT_TYPES:
+            elementDicts.add(elementType)
+            elements = getattr(novel, elementType)
+            sortOrder = {}
+            if sortListName is not None:
+                elementDicts.add(sortListName)
+                for i, elemId in enumerate(getattr(novel, sortListName)):
+                    sortOrder[elemId] = i
+            digests[elementType] = {}
+            for elemId in elements:
+                digests[elementType][elemId] = cls._get_digest(elements[elemId], sortOrder.get(elemId, None))
+        project = {key: value for key, value in vars(novel).items() if not key in elementDicts}
+        digests['project'] = {'': cls._get_digest(project, None)}
+        return digests
+
+    @classmethod
+    def _get_digest(cls, element, sortOrder):
+        """Return the content hash of an element or an attribute dictionary."""
+        if not isinstance(element, dict):
+            element = cls._get_attributes(element)
+        data = {key: value for key, value in element.items() if not key in cls._DERIVED}
+        data = json.dumps([data, sortOrder], sort_keys=True, default=str)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _get_attributes(cls, element):
+        """Return a dictionary of the element's instance variables, which may be slots."""
+        try:
+            return vars(element)
+
+        except TypeError:
+            attributes = {}
+            for elementClass in type(element).__mro__:
+                for name in getattr(elementClass, '__slots__', ()):
+                    attributes[name] = getattr(element, name)
+            return attributes
+
+    def _get_key(self, sourcePath):
+        """Return the document's path relative to the project directory, if possible."""
+        sourcePath = os.path.realpath(sourcePath)
+        try:
+            return os.path.relpath(sourcePath, os.path.dirname(os.path.realpath(self.ywPath)))
+
+        except ValueError:
+            # Windows: the document is on another drive
+            return sourcePath
+
+    def _new_data(self):
+        return dict(version=self._VERSION, documents={})
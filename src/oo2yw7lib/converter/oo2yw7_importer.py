@@ -0,0 +1,161 @@
+"""Provide a converter class for the oo2yw7 document import. 
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.pywriter_globals import *
+from pywriter.converter.yw7_importer import Yw7Importer
+from pywriter.model.novel import Novel
+from oo2yw7lib.converter.import_cache import ImportCache
+from oo2yw7lib.converter.phase_timer import PhaseTimer
+from oo2yw7lib.converter.stream_project_factory import StreamProjectFactory
+from oo2yw7lib.converter.timed_file_factory import TimedFileFactory
+from oo2yw7lib.yw.yw7_fast_file import Yw7FastFile
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRProof
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRManuscript
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRSceneDesc
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRChapterDesc
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRPartDesc
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRCharacters
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRItems
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRLocations
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRNotes
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRTodo
+from oo2yw7lib.ods_r.ods_stream_readers import StreamOdsRCharList
+from oo2yw7lib.ods_r.ods_stream_readers import StreamOdsRLocList
+from oo2yw7lib.ods_r.ods_stream_readers import StreamOdsRItemList
+from oo2yw7lib.ods_r.ods_stream_readers import StreamOdsRSceneList
+
+
+class Oo2yw7Importer(Yw7Importer):
+    """A converter for importing OpenOffice/LibreOffice documents to yWriter 7 projects.
+
+    Public instance variables:
+        updatedElements -- dict: numbers of elements changed by the last import, by element type.
+        phaseTimer -- PhaseTimer instance measuring the conversion phases. 
+
+    Use the oo2yw7 file classes instead of the pywriter ones.
+    Keep an import cache next to the project, so that unchanged documents are not imported again,
+    and the project file is not rewritten if the import changes nothing.
+
+    Assign a PhaseRecorder instance to phaseTimer in order to measure the conversion phases:
+    "detect", "check cache", "read target", "read source", "split scenes", 
+    "compare", "write", "build tree", "serialize", and "update cache".
+    The file factories are wrapped, so that the file type detection and
+    the file objects' read() and write() methods are measured
+    without changing the superclass's control flow.
+    The file objects involved get the same phaseTimer.
+    """
+    EXPORT_SOURCE_CLASSES = [Yw7FastFile]
+    IMPORT_SOURCE_CLASSES = [StreamOdtRProof,
+                             StreamOdtRManuscript,
+                             StreamOdtRSceneDesc,
+                             StreamOdtRChapterDesc,
+                             StreamOdtRPartDesc,
+                             StreamOdtRCharacters,
+                             StreamOdtRItems,
+                             StreamOdtRLocations,
+                             StreamOdtRNotes,
+                             StreamOdtRTodo,
+                             StreamOdsRCharList,
+                             StreamOdsRLocList,
+                             StreamOdsRItemList,
+                             StreamOdsRSceneList,
+                             ]
+    IMPORT_TARGET_CLASSES = [Yw7FastFile]
+
+    def __init__(self):
+        """Use a factory that does not load the whole document for type detection.
+        
+        Wrap all file factories for measuring the conversion phases.
+        Extends the superclass constructor.
+        """
+        super().__init__()
+        self.exportSourceFactory = TimedFileFactory(self.exportSourceFactory, self)
+        self.exportTargetFactory = TimedFileFactory(self.exportTargetFactory, self)
+        self.importSourceFactory = TimedFileFactory(self.importSourceFactory, self)
+        self.importTargetFactory = TimedFileFactory(self.importTargetFactory, self)
+        self.newProjectFactory = TimedFileFactory(StreamProjectFactory(self.CREATE_SOURCE_CLASSES), self)
+        self.updatedElements = {}
+        self.phaseTimer = PhaseTimer()
+
+    def create_yw7(self, source, target):
+        """Create a yWriter project and its import cache.
+
+        Positional arguments:
+            source -- document file instance.
+            target -- Yw7File instance.
+
+        Extends the superclass method.
+        """
+        self.updatedElements = {}
+        super().create_yw7(source, target)
+        if self.newFile:
+            cache = ImportCache(target.filePath)
+            cache.read()
+            self._update_cache(source, cache)
+
+    def import_to_yw(self, source, target):
+        """Update a yWriter project from a document, if anything has changed.
+
+        Positional arguments:
+            source -- document file instance.
+            target -- Yw7File instance.
+
+        - Skip the import if neither the document nor the project file
+          has changed since the document was imported last.
+        - Otherwise, import the document and compare the content hashes of the
+          project elements before and after. Write the project file only if
+          there are differences, and report the number of changed elements.
+
+        Overrides the superclass method.
+        """
+        self.ui.set_info_what(
+            _('Input: {0} "{1}"\nOutput: {2} "{3}"').format(source.DESCRIPTION, norm_path(source.filePath), target.DESCRIPTION, norm_path(target.filePath)))
+        self.newFile = None
+        self.updatedElements = {}
+        with self.phaseTimer.measure('check cache'):
+            cache = ImportCache(target.filePath)
+            cache.read()
+            upToDate = cache.is_up_to_date(source.filePath)
+        if upToDate:
+            self.ui.set_info_how(f'{_("Document unchanged since last import")}: "{norm_path(source.filePath)}".')
+            return
+
+        try:
+            self.check(source, target)
+            target.novel = Novel()
+            target.read()
+            with self.phaseTimer.measure('compare'):
+                oldDigests = cache.get_novel_digests(target.novel)
+            source.novel = target.novel
+            source.read()
+            target.novel = source.novel
+            with self.phaseTimer.measure('compare'):
+                self.updatedElements = cache.get_dirty_elements(oldDigests, cache.get_novel_digests(target.novel))
+            if self.updatedElements:
+                target.write()
+        except Exception as ex:
+            message = f'!{str(ex)}'
+        else:
+            if self.updatedElements:
+                message = f'{_("File written")}: "{norm_path(target.filePath)}" ({_("changed elements")}: {sum(self.updatedElements.values())}).'
+                self.newFile = target.filePath
+                if source.scenesSplit:
+                    self.ui.show_warning(_('New scenes created during conversion.'))
+            else:
+                message = f'{_("Project is up to date")}: "{norm_path(target.filePath)}".'
+            self._update_cache(source, cache)
+        finally:
+            self.ui.set_info_how(message)
+
+    def _update_cache(self, source, cache):
+        """Store the content hashes of the document and the project after an import."""
+        with self.phaseTimer.measure('update cache'):
+            try:
+                cache.update(source.filePath)
+            except:
+                return
+
+            cache.write()
@@ -0,0 +1,96 @@
+"""Provide a class for recording the time and memory of the conversion phases.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import tracemalloc
+from time import perf_counter
+from oo2yw7lib.converter.phase_timer import PhaseTimer
+
+
+class PhaseRecorder(PhaseTimer):
+    """Record wall time and peak memory of the conversion phases.
+
+    Public methods:
+        start(phase) -- Start measuring a conversion phase.
+        stop(phase) -- Stop measuring a conversion phase.
+        reset() -- Discard the recorded phases.
+
+    Public instance variables:
+        traceMemory -- bool: if True, the peak memory of each phase is traced.
+        phases -- dict: key = phase name, value = dict with the following keys:
+            calls -- int: number of times the phase was run.
+            time -- float: total wall time in seconds.
+            peak -- int: maximum memory allocated during the phase in bytes, or None.
+
+    Phases may be nested. The time and memory of a phase include its subphases.
+    Memory is traced with tracemalloc, which slows down the conversion.
+    This requires Python 3.9+; with older versions, no memory is recorded.
+    """
+
+    def __init__(self, traceMemory=True):
+        """Initialize instance variables.
+
+        Optional arguments:
+            traceMemory -- bool: if True, trace the peak memory of each phase.
+        """
+        self.traceMemory = traceMemory and hasattr(tracemalloc, 'reset_peak')
+        self.phases = {}
+        self._running = []
+        # stack of [phase, start time, memory at start, peak memory of finished subphases]
+        self._tracing = False
+
+    def reset(self):
+        """Discard the recorded phases."""
+        self.phases = {}
+
+    def start(self, phase):
+        """Start measuring a conversion phase.
+        
+        Positional arguments:
+            phase -- str: name of the phase.
+
+        Overrides the superclass method.
+        """
+        startMemory = None
+        if self.traceMemory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            startMemory, peak = tracemalloc.get_traced_memory()
+            if self._running:
+                self._running[-1][3] = max(self._running[-1][3], peak)
+            tracemalloc.reset_peak()
+        self._running.append([phase, perf_counter(), startMemory, 0])
+
+    def stop(self, phase):
+        """Stop measuring a conversion phase.
+        
+        Positional arguments:
+            phase -- str: name of the phase.
+
+        Overrides the superclass method.
+        """
+        if not self._running or self._running[-1][0] != phase:
+            return
+
+        __, startTime, startMemory, peak = self._running.pop()
+        elapsed = perf_counter() - startTime
+        if self.traceMemory:
+            __, currentPeak = tracemalloc.get_traced_memory()
+            peak = max(peak, currentPeak)
+            if self._running:
+                self._running[-1][3] = max(self._running[-1][3], peak)
+            tracemalloc.reset_peak()
+            peak -= startMemory
+            if self._tracing and not self._running:
+                tracemalloc.stop()
+                self._tracing = False
+        else:
+            peak = None
+        record = self.phases.setdefault(phase, dict(calls=0, time=0.0, peak=None))
+        record['calls'] += 1
+        record['time'] += elapsed
+        if peak is not None:
+            record['peak'] = max(record['peak'] or 0, peak)
@@ -0,0 +1,53 @@
+"""Provide a class for optional timing of the conversion phases.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Conversion phase timer that does not measure anything.
+
+    Public methods:
+        measure(phase) -- Context manager for measuring a conversion phase.
+        start(phase) -- Start measuring a conversion phase.
+        stop(phase) -- Stop measuring a conversion phase.
+
+    Converters and files use an instance of this class by default,
+    so timing is switched off unless a PhaseRecorder instance is assigned.
+    """
+
+    @contextmanager
+    def measure(self, phase):
+        """Context manager for measuring a conversion phase.
+        
+        Positional arguments:
+            phase -- str: name of the phase.
+        """
+        self.start(phase)
+        try:
+            yield
+        finally:
+            self.stop(phase)
+
+    def start(self, phase):
+        """Start measuring a conversion phase.
+        
+        Positional arguments:
+            phase -- str: name of the phase.
+
+        To be overridden by subclasses.
+        """
+        pass
+
+    def stop(self, phase):
+        """Stop measuring a conversion phase.
+        
+        Positional arguments:
+            phase -- str: name of the phase.
+
+        To be overridden by subclasses.
+        """
+        pass
@@ -0,0 +1,88 @@
+"""Provide a factory class for a document object to read and a new yw7 project.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import zipfile
+from pywriter.pywriter_globals import *
+from pywriter.converter.new_project_factory import NewProjectFactory
+from oo2yw7lib.yw.yw7_fast_file import Yw7FastFile
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtROutline
+from oo2yw7lib.odt_r.odt_stream_r_import import StreamOdtRImport
+
+
+class StreamProjectFactory(NewProjectFactory):
+    """A factory class that instantiates a document object to read, 
+    and a new yWriter project.
+
+    Public methods:
+        make_file_objects(sourcePath, **kwargs) -- return conversion objects.
+
+    Unlike the superclass, this factory does not load content.xml into memory 
+    in order to find out whether an ODT document is an outline.
+    """
+    _OUTLINE_MARKER = b'Heading_20_3'
+    _CHUNK_SIZE = 0x10000
+
+    def make_file_objects(self, sourcePath, **kwargs):
+        """Instantiate a source and a target object for creation of a new yWriter project.
+
+        Positional arguments:
+            sourcePath -- string; path to the source file to convert.
+
+        Return a tuple with two elements:
+        - sourceFile: a Novel subclass instance
+        - targetFile: a Novel subclass instance
+        
+        Raise the "Error" exception in case of error. 
+        Overrides the superclass method.
+        """
+        if not self._canImport(sourcePath):
+            raise Error(f'{_("This document is not meant to be written back")}.')
+
+        fileName, __ = os.path.splitext(sourcePath)
+        targetFile = Yw7FastFile(f'{fileName}{Yw7FastFile.EXTENSION}', **kwargs)
+        if sourcePath.endswith('.odt'):
+            if self._is_outline(sourcePath):
+                sourceFile = StreamOdtROutline(sourcePath, **kwargs)
+            else:
+                sourceFile = StreamOdtRImport(sourcePath, **kwargs)
+            return sourceFile, targetFile
+
+        else:
+            for fileClass in self._fileClasses:
+                if fileClass.SUFFIX is not None:
+                    if sourcePath.endswith(f'{fileClass.SUFFIX}{fileClass.EXTENSION}'):
+                        sourceFile = fileClass(sourcePath, **kwargs)
+                        return sourceFile, targetFile
+
+            raise Error(f'{_("File type is not supported")}: "{norm_path(sourcePath)}".')
+
+    def _is_outline(self, sourcePath):
+        """Return True if the document's content.xml refers to the "Heading 3" style.
+        
+        Positional arguments:
+            sourcePath -- str: path of the ODT document.
+            
+        Read content.xml chunk by chunk and stop at the first occurrence of the style name.
+        Only the current chunk and an overlap of the marker length are held in memory.
+        Raise the "Error" exception if the document cannot be read.
+        """
+        overlap = len(self._OUTLINE_MARKER) - 1
+        try:
+            with zipfile.ZipFile(sourcePath, 'r') as odfFile:
+                with odfFile.open('content.xml') as contentFile:
+                    tail = b''
+                    while True:
+                        chunk = contentFile.read(self._CHUNK_SIZE)
+                        if not chunk:
+                            return False
+
+                        if self._OUTLINE_MARKER in tail + chunk:
+                            return True
+
+                        tail = chunk[-overlap:]
+        except:
+            raise Error(f'{_("Cannot read file")}: "{norm_path(sourcePath)}".')
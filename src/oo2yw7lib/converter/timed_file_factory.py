@@ -0,0 +1,70 @@
+"""Provide a wrapper class for file factories that measures the conversion phases.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+
+
+class TimedFileFactory:
+    """Wrapper for a file factory, measuring the phases of the file objects it makes.
+
+    Public methods:
+        make_file_objects(sourcePath, **kwargs) -- Return conversion objects with measured methods.
+
+    The file type detection is measured as "detect".
+    The source's read() method is measured as "read source", 
+    the target's read() and write() methods are measured as "read target" and "write".
+    The converter's control flow is not changed, 
+    because only the factory and the file objects' methods are wrapped.
+    """
+
+    def __init__(self, factory, converter):
+        """Set the wrapped factory and the converter.
+
+        Positional arguments:
+            factory -- file factory instance to wrap.
+            converter -- converter instance whose phaseTimer is used.
+
+        The converter's phaseTimer is looked up with each call, 
+        so it can be replaced after the factory is created.
+        """
+        self._factory = factory
+        self._converter = converter
+
+    def make_file_objects(self, sourcePath, **kwargs):
+        """Return conversion objects with measured methods.
+
+        Positional arguments:
+            sourcePath -- str: path to the source file to convert.
+
+        Return a tuple with two elements, as the wrapped factory:
+        - sourceFile: a Novel subclass instance, or None
+        - targetFile: a Novel subclass instance, or None
+
+        File objects that measure their own phases get the converter's phaseTimer.
+        Raise the "Error" exception in case of error. 
+        """
+        phaseTimer = self._converter.phaseTimer
+        with phaseTimer.measure('detect'):
+            sourceFile, targetFile = self._factory.make_file_objects(sourcePath, **kwargs)
+        if sourceFile is not None:
+            self._measure_method(sourceFile, 'read', 'read source')
+        if targetFile is not None:
+            self._measure_method(targetFile, 'read', 'read target')
+            self._measure_method(targetFile, 'write', 'write')
+        for fileObject in (sourceFile, targetFile):
+            if hasattr(fileObject, 'phaseTimer'):
+                fileObject.phaseTimer = phaseTimer
+        return sourceFile, targetFile
+
+    def _measure_method(self, fileObject, methodName, phase):
+        """Replace a method of a file object with a measured one."""
+        method = getattr(fileObject, methodName)
+        converter = self._converter
+
+        def measured_method(*args, **kwargs):
+            with converter.phaseTimer.measure(phase):
+                return method(*args, **kwargs)
+
+        setattr(fileObject, methodName, measured_method)
@@ -0,0 +1,40 @@
+"""Provide a compact class for yWriter chapter representation.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+
+
+class CompactChapter:
+    """yWriter chapter representation.
+    
+    Public instance variables:
+        The same as pywriter's Chapter class.
+
+    The instance variables are slots, so a chapter takes up less memory than 
+    a pywriter Chapter instance. This is why the class is not derived from Chapter.
+    """
+    __slots__ = (
+        'title',
+        'desc',
+        'kwVar',
+        'chLevel',
+        'chType',
+        'suppressChapterTitle',
+        'isTrash',
+        'suppressChapterBreak',
+        'srtScenes',
+        )
+
+    def __init__(self):
+        """Initialize instance variables like pywriter's Chapter constructor."""
+        self.title = None
+        self.desc = None
+        self.kwVar = {}
+        self.chLevel = None
+        self.chType = None
+        self.suppressChapterTitle = None
+        self.isTrash = None
+        self.suppressChapterBreak = None
+        self.srtScenes = []
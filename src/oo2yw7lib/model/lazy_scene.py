@@ -0,0 +1,149 @@
+"""Provide a compact class for yWriter scene representation with word count on demand.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.model.scene import Scene
+from pywriter.model.scene import ADDITIONAL_WORD_LIMITS
+from pywriter.model.scene import NO_WORD_LIMITS
+from pywriter.model.scene import NON_LETTERS
+
+
+class LazyScene:
+    """yWriter scene representation.
+    
+    Public instance variables:
+        The same as pywriter's Scene class, with:
+        sceneContent -- str: scene content (property with setter).
+        wordCount - int: word count (property with setter).
+        letterCount - int: letter count (property with setter).
+
+    Word count and letter count are not computed when the scene content is assigned,
+    but when they are read for the first time after a change.
+    Assigned counts are kept until the scene content changes.
+    
+    The instance variables are slots, so a scene takes up much less memory than 
+    a pywriter Scene instance. This is why the class is not derived from Scene.
+    """
+    STATUS = Scene.STATUS
+    ACTION_MARKER = Scene.ACTION_MARKER
+    REACTION_MARKER = Scene.REACTION_MARKER
+    NULL_DATE = Scene.NULL_DATE
+    NULL_TIME = Scene.NULL_TIME
+
+    __slots__ = (
+        'title',
+        'desc',
+        'kwVar',
+        '_sceneContent',
+        '_wordCount',
+        '_letterCount',
+        'scType',
+        'doNotExport',
+        'status',
+        'notes',
+        'tags',
+        'field1',
+        'field2',
+        'field3',
+        'field4',
+        'appendToPrev',
+        'isReactionScene',
+        'isSubPlot',
+        'goal',
+        'conflict',
+        'outcome',
+        'characters',
+        'locations',
+        'items',
+        'date',
+        'time',
+        'day',
+        'lastsMinutes',
+        'lastsHours',
+        'lastsDays',
+        'image',
+        'scnArcs',
+        'scnStyle',
+        )
+
+    def __init__(self):
+        """Initialize instance variables like pywriter's Scene constructor."""
+        self.title = None
+        self.desc = None
+        self.kwVar = {}
+        self._sceneContent = None
+        self._wordCount = 0
+        self._letterCount = 0
+        self.scType = None
+        self.doNotExport = None
+        self.status = None
+        self.notes = None
+        self.tags = None
+        self.field1 = None
+        self.field2 = None
+        self.field3 = None
+        self.field4 = None
+        self.appendToPrev = None
+        self.isReactionScene = None
+        self.isSubPlot = None
+        self.goal = None
+        self.conflict = None
+        self.outcome = None
+        self.characters = None
+        self.locations = None
+        self.items = None
+        self.date = None
+        self.time = None
+        self.day = None
+        self.lastsMinutes = None
+        self.lastsHours = None
+        self.lastsDays = None
+        self.image = None
+        self.scnArcs = None
+        self.scnStyle = None
+
+    @property
+    def sceneContent(self):
+        return self._sceneContent
+
+    @sceneContent.setter
+    def sceneContent(self, text):
+        """Set the scene content and discard the counts."""
+        self._sceneContent = text
+        self._wordCount = None
+        self._letterCount = None
+
+    @property
+    def wordCount(self):
+        if self._wordCount is None:
+            self._count()
+        return self._wordCount
+
+    @wordCount.setter
+    def wordCount(self, count):
+        self._wordCount = count
+
+    @property
+    def letterCount(self):
+        if self._letterCount is None:
+            self._count()
+        return self._letterCount
+
+    @letterCount.setter
+    def letterCount(self, count):
+        self._letterCount = count
+
+    def _count(self):
+        """Compute and cache word count and letter count of the scene content."""
+        if not self._sceneContent:
+            self._wordCount = 0
+            self._letterCount = 0
+            return
+
+        text = ADDITIONAL_WORD_LIMITS.sub(' ', self._sceneContent)
+        text = NO_WORD_LIMITS.sub('', text)
+        self._wordCount = len(text.split())
+        text = NON_LETTERS.sub('', self._sceneContent)
+        self._letterCount = len(text)
@@ -0,0 +1,127 @@
+"""Provide a class for ODS content XML parsing while unzipping.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import zipfile
+import xml.etree.ElementTree as ET
+from pywriter.pywriter_globals import *
+from pywriter.ods_r.ods_parser import OdsParser
+
+
+class OdsStreamParser(OdsParser):
+    """An ODS document parser that does not load the whole table.
+
+    Public methods:
+        get_rows(filePath, cellsPerRow) -- Return an iterator over the rows of the first table.
+
+    content.xml is parsed incrementally from the zip member stream.
+    Each row is discarded after processing,
+    and repeated cells are not expanded element by element.
+    """
+    _OFFICE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}'
+    _TABLE = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}'
+    _TEXT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+
+    def get_rows(self, filePath, cellsPerRow):
+        """Return an iterator over the rows of the first table.
+
+        Positional arguments:
+            filePath -- str: ODS document path.
+            cellsPerRow -- int: maximum number of cells per row.
+
+        Each row is a list of cell contents as strings.
+        Rows whose first cell is empty are skipped.
+        A repeated row is returned once, as by the superclass,
+        because a second row with the same ID would duplicate the element.
+        Parsing stops at the end of the first table.
+        Raise the "Error" exception if the document cannot be opened.
+        Overrides the superclass method.
+        """
+        try:
+            odfFile = zipfile.ZipFile(filePath, 'r')
+        except:
+            raise Error(f'{_("Cannot read file")}: "{norm_path(filePath)}".')
+
+        with odfFile:
+            try:
+                contentFile = odfFile.open('content.xml')
+            except KeyError:
+                raise Error(f'{_("Cannot read file")}: "{norm_path(filePath)}".')
+
+            with contentFile:
+                yield from self._get_table_rows(contentFile, cellsPerRow)
+
+    def _get_table_rows(self, contentFile, cellsPerRow):
+        """Return an iterator over the rows of the first table in a content.xml file.
+
+        Positional arguments:
+            contentFile -- binary file object.
+            cellsPerRow -- int: maximum number of cells per row.
+
+        Only rows at the top level of the table are taken into account.
+        """
+        parents = []
+        table = None
+        for event, element in ET.iterparse(contentFile, events=('start', 'end')):
+            if event == 'start':
+                if table is None and element.tag == f'{self._TABLE}table':
+                    if parents and parents[-1].tag == f'{self._OFFICE}spreadsheet':
+                        table = element
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if element is table:
+                return
+
+            if table is None or parents[-1] is not table:
+                continue
+
+            table.remove(element)
+            if element.tag != f'{self._TABLE}table-row':
+                continue
+
+            cells = self._get_cells(element, cellsPerRow)
+            if cells:
+                yield cells
+
+    def _get_cells(self, row, cellsPerRow):
+        """Return a list of cell contents.
+
+        Positional arguments:
+            row -- table row element.
+            cellsPerRow -- int: maximum number of cells.
+
+        Return an empty list if the first cell is empty.
+        """
+        cells = []
+        for cell in row.findall(f'{self._TABLE}table-cell'):
+            paragraphs = cell.findall(f'{self._TEXT}p')
+            if paragraphs:
+                content = '\n'.join([''.join(paragraph.itertext()) for paragraph in paragraphs])
+            elif cells:
+                content = ''
+            else:
+                break
+
+            repeat = min(self._get_repeat(cell, 'number-columns-repeated'), cellsPerRow - len(cells))
+            cells.extend([content] * repeat)
+            if len(cells) >= cellsPerRow:
+                break
+
+        return cells
+
+    def _get_repeat(self, element, attribute):
+        """Return the number of repetitions of a table cell.
+
+        Positional arguments:
+            element -- table cell element.
+            attribute -- str: name of the repetition attribute without namespace.
+        """
+        repeat = element.get(f'{self._TABLE}{attribute}')
+        if repeat:
+            return max(1, int(repeat))
+
+        return 1
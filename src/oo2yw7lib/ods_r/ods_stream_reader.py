@@ -0,0 +1,42 @@
+"""Provide a base class for ODS documents that are parsed while unzipping.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.pywriter_globals import *
+from pywriter.ods_r.ods_reader import OdsReader
+from oo2yw7lib.ods_r.ods_stream_parser import OdsStreamParser
+
+
+class OdsStreamReader(OdsReader):
+    """Abstract ODS file reader that processes the table row by row.
+
+    Public methods:
+        read() -- Provide the rows of the table.
+
+    The rows are not collected in a list;
+    "_rows" is an iterator that parses the next row when the subclass asks for it.
+    Place this class after the pywriter reader class in the bases of a subclass,
+    so that the subclass's read method consumes the iterator.
+    """
+
+    def read(self):
+        """Provide the rows of the table.
+        
+        Overrides the superclass method.
+        """
+        self._rows = self._get_checked_rows()
+
+    def _get_checked_rows(self):
+        """Return an iterator over the table rows, checking each row's structure.
+        
+        Raise the "Error" exception if a row has not as many cells as there are row titles.
+        """
+        cellsPerRow = len(self._rowTitles)
+        parser = OdsStreamParser()
+        for row in parser.get_rows(self.filePath, cellsPerRow):
+            if len(row) != cellsPerRow:
+                raise Error(f'{_("Wrong table structure")}.')
+
+            yield row
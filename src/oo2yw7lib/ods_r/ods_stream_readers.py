@@ -0,0 +1,29 @@
+"""Provide ODS reader classes that parse the documents row by row while unzipping.
+
+The document-specific handling is inherited from the pywriter reader classes.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.ods_r.ods_r_charlist import OdsRCharList
+from pywriter.ods_r.ods_r_loclist import OdsRLocList
+from pywriter.ods_r.ods_r_itemlist import OdsRItemList
+from pywriter.ods_r.ods_r_scenelist import OdsRSceneList
+from oo2yw7lib.ods_r.ods_stream_reader import OdsStreamReader
+
+
+class StreamOdsRSceneList(OdsRSceneList, OdsStreamReader):
+    """ODS scene list reader parsing the document row by row."""
+
+
+class StreamOdsRCharList(OdsRCharList, OdsStreamReader):
+    """ODS character list reader parsing the document row by row."""
+
+
+class StreamOdsRLocList(OdsRLocList, OdsStreamReader):
+    """ODS location list reader parsing the document row by row."""
+
+
+class StreamOdsRItemList(OdsRItemList, OdsStreamReader):
+    """ODS item list reader parsing the document row by row."""
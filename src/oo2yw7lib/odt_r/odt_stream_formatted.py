@@ -0,0 +1,88 @@
+"""Provide a base class for formatted ODT documents that are parsed while unzipping.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import re
+from pywriter.odt_r.odt_r_formatted import OdtRFormatted
+from pywriter.model.splitter import Splitter
+from oo2yw7lib.odt_r.odt_stream_reader import OdtStreamReader
+from oo2yw7lib.converter.phase_timer import PhaseTimer
+
+
+class OdtStreamFormatted(OdtStreamReader, OdtRFormatted):
+    """Abstract reader for ODT documents with formatted scene content.
+
+    Public methods:
+        read() -- Parse the file and get the instance variables.
+
+    Public instance variables:
+        phaseTimer -- PhaseTimer instance measuring the "split scenes" phase of reading.
+
+    Adjacent runs of the same inline tag are merged by a single regular expression 
+    covering all tags and languages, instead of replacing each tag separately.
+    """
+    _ADJACENT_TAGS = re.compile(r'\[/(i|b|lang=[^\]]*)\](\n(?:> )?)?\[\1\]')
+    # closing tag, optional line break or quotation line break, and the same opening tag
+    _TAG_BEFORE = (']', ']\n', ']\n>', ']\n> ')
+    _TAG_AFTER = ('[', '\n[', '\n> [', '> [', ' [')
+    # end of a tag and start of a tag, with a line break or quotation line break in between,
+    # which may be split on both sides of the merged tags
+
+    def __init__(self, filePath, **kwargs):
+        """Initialize instance variables.
+
+        Positional arguments:
+            filePath -- str: path to the file represented by the Novel instance.
+            
+        Optional arguments:
+            kwargs -- keyword arguments (not used here).            
+        
+        Extends the superclass constructor.
+        """
+        super().__init__(filePath, **kwargs)
+        self.phaseTimer = PhaseTimer()
+        self._enclosedTags = False
+
+    def read(self):
+        """Parse the file and split scenes, if scene dividers are found.
+        
+        Overrides the superclass method.
+        """
+        self.novel.languages = []
+        self.feed_file(self.filePath)
+        with self.phaseTimer.measure('split scenes'):
+            sceneSplitter = Splitter()
+            self.scenesSplit = sceneSplitter.split_scenes(self)
+
+    def _cleanup_scene(self, text):
+        """Return the scene text with adjacent runs of the same inline tag merged.
+        
+        Positional arguments:
+            text -- str: scene text.
+        
+        Repeat the substitution only if a merged pair of tags was enclosed by other tags, 
+        because only then merging can make other tags adjacent, as in "[/i][/b][b][i]".
+        Overrides the superclass method.
+        """
+        self._enclosedTags = True
+        while self._enclosedTags:
+            self._enclosedTags = False
+            text = self._ADJACENT_TAGS.sub(self._merge_tags, text)
+        return text
+
+    def _merge_tags(self, match):
+        """Return the replacement for a pair of adjacent tags.
+        
+        Positional arguments:
+            match -- re.Match instance of the adjacent tags.
+        
+        Keep the line break between the tags.
+        Note whether the pair is enclosed by other tags, with or without a line break between.
+        """
+        text = match.string
+        if text[max(0, match.start() - 4):match.start()].endswith(self._TAG_BEFORE):
+            if text[match.end():match.end() + 4].startswith(self._TAG_AFTER):
+                self._enclosedTags = True
+        return match.group(2) or ''
@@ -0,0 +1,114 @@
+"""Provide a class for ODT "work in progress" import with linear-time scene accumulation.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.pywriter_globals import *
+from pywriter.model.scene import Scene
+from pywriter.odt_r.odt_r_import import OdtRImport
+from oo2yw7lib.odt_r.odt_stream_formatted import OdtStreamFormatted
+
+
+class StreamOdtRImport(OdtStreamFormatted, OdtRImport):
+    """ODT "work in progress" file reader.
+
+    Public methods:
+        handle_data -- Collect data within scene sections.
+        handle_endtag -- Recognize the paragraph's end.      
+        handle_starttag -- Recognize the paragraph's beginning.  
+        endDocument -- Assign the text of the last scene.
+
+    The superclass assigns the whole scene text to the scene after each paragraph.
+    This class accumulates the paragraphs and assigns the scene text once,
+    when the scene is complete, so the words are counted once per scene.
+    """
+
+    def __init__(self, filePath, **kwargs):
+        """Initialize local instance variables for parsing.
+
+        Positional arguments:
+            filePath -- str: path to the file represented by the Novel instance.
+            
+        Extends the superclass constructor.
+        """
+        super().__init__(filePath)
+        self._sceneLength = None
+        # number of strings in _lines at the end of the scene's last paragraph
+
+    def endDocument(self):
+        """Assign the text of the last scene.
+        
+        Overrides the xml.sax.ContentHandler method.
+        """
+        self._commit_scene()
+
+    def handle_data(self, data):
+        """Collect data within scene sections.
+
+        Positional arguments:
+            data -- str: text to be stored. 
+        
+        Extends the superclass method.
+        """
+        if self._scId is not None and self._SCENE_DIVIDER in data:
+            self._commit_scene()
+        super().handle_data(data)
+
+    def handle_endtag(self, tag):
+        """Recognize the paragraph's end.      
+        
+        Positional arguments:
+            tag -- str: name of the tag converted to lower case.
+
+        Extends the superclass method.
+        """
+        if tag in ('p', 'blockquote'):
+            if self._language:
+                self._lines.append(f'[/lang={self._language}]')
+                self._language = ''
+            self._lines.append('\n')
+            if self._scId is not None:
+                self._sceneLength = len(self._lines)
+        else:
+            super().handle_endtag(tag)
+
+    def handle_starttag(self, tag, attrs):
+        """Recognize the paragraph's beginning.
+        
+        Positional arguments:
+            tag -- str: name of the tag converted to lower case.
+            attrs -- list of (name, value) pairs containing the attributes found inside the tag’s <> brackets.
+        
+        Extends the superclass method.
+        """
+        if tag == 'p':
+            if self._scId is None and self._chId is not None:
+                self._lines = []
+                self._sceneLength = None
+                self._scCount += 1
+                self._scId = str(self._scCount)
+                self.novel.scenes[self._scId] = Scene()
+                self.novel.chapters[self._chId].srtScenes.append(self._scId)
+                self.novel.scenes[self._scId].status = '1'
+                self.novel.scenes[self._scId].title = f'{_("Scene")} {self._scCount}'
+        elif tag in ('h1', 'h2', 'div'):
+            self._commit_scene()
+        super().handle_starttag(tag, attrs)
+
+    def _commit_scene(self):
+        """Assign the text up to the last paragraph's end to the current scene.
+        
+        Set the scene status depending on the word count.
+        """
+        if self._scId is None or self._sceneLength is None:
+            return
+
+        sceneText = ''.join(self._lines[:self._sceneLength]).rstrip()
+        sceneText = self._cleanup_scene(sceneText)
+        self.novel.scenes[self._scId].sceneContent = sceneText
+        if self.novel.scenes[self._scId].wordCount < self._LOW_WORDCOUNT:
+            self.novel.scenes[self._scId].status = Scene.STATUS.index('Outline')
+        else:
+            self.novel.scenes[self._scId].status = Scene.STATUS.index('Draft')
+        self._sceneLength = None
@@ -0,0 +1,110 @@
+"""Provide a base class for ODT documents that are parsed while unzipping.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import zipfile
+import xml.etree.ElementTree as ET
+from xml import sax
+from pywriter.pywriter_globals import *
+from pywriter.odt_r.odt_reader import OdtReader
+
+
+class OdtStreamReader(OdtReader):
+    """Abstract ODT file reader that opens the document only once.
+
+    Public methods:
+        feed_file(filePath) -- Feed an ODT file to the parser.
+        read() -- Parse the file and get the instance variables.
+
+    content.xml is not loaded into memory as a whole,
+    but fed to the SAX parser chunk by chunk from the zip member stream.
+    Place this class before the pywriter reader class in the bases of a subclass.
+    """
+    _NAMESPACES = dict(
+        office='urn:oasis:names:tc:opendocument:xmlns:office:1.0',
+        style='urn:oasis:names:tc:opendocument:xmlns:style:1.0',
+        fo='urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0',
+        dc='http://purl.org/dc/elements/1.1/',
+        meta='urn:oasis:names:tc:opendocument:xmlns:meta:1.0'
+        )
+
+    def feed_file(self, filePath):
+        """Feed an ODT file to the parser.
+        
+        Positional arguments:
+            filePath -- str: ODT document path.
+        
+        First process the default language from styles.xml and the metadata from meta.xml.
+        Then stream content.xml through the SAX parser.
+        Raise the "Error" exception if the document cannot be opened.
+        Overrides the superclass method.
+        """
+        try:
+            odfFile = zipfile.ZipFile(filePath, 'r')
+        except:
+            raise Error(f'{_("Cannot read file")}: "{norm_path(filePath)}".')
+
+        with odfFile:
+            try:
+                with odfFile.open('styles.xml') as stylesFile:
+                    styles = ET.parse(stylesFile).getroot()
+                odfFile.getinfo('content.xml')
+            except KeyError:
+                raise Error(f'{_("Cannot read file")}: "{norm_path(filePath)}".')
+
+            self._feed_styles(styles)
+            try:
+                with odfFile.open('meta.xml') as metaFile:
+                    self._feed_meta(ET.parse(metaFile).getroot())
+            except KeyError:
+                pass
+            parser = sax.make_parser()
+            parser.setContentHandler(self)
+            with odfFile.open('content.xml') as contentFile:
+                parser.parse(contentFile)
+
+    def read(self):
+        """Parse the file and get the instance variables.
+        
+        Overrides the superclass method.
+        """
+        self.feed_file(self.filePath)
+
+    def _feed_meta(self, root):
+        """Pass title, author, and description to the handler.
+        
+        Positional arguments:
+            root -- root element of meta.xml.
+        """
+        meta = root.find('office:meta', self._NAMESPACES)
+        title = meta.find('dc:title', self._NAMESPACES)
+        if title is not None:
+            if title.text:
+                self.handle_starttag('title', [()])
+                self.handle_data(title.text)
+                self.handle_endtag('title')
+        author = meta.find('meta:initial-creator', self._NAMESPACES)
+        if author is not None:
+            if author.text:
+                self.handle_starttag('meta', [('', 'author'), ('', author.text)])
+        desc = meta.find('dc:description', self._NAMESPACES)
+        if desc is not None:
+            if desc.text:
+                self.handle_starttag('meta', [('', 'description'), ('', desc.text)])
+
+    def _feed_styles(self, root):
+        """Pass the document's default language to the handler.
+        
+        Positional arguments:
+            root -- root element of styles.xml.
+        """
+        styles = root.find('office:styles', self._NAMESPACES)
+        for defaultStyle in styles.findall('style:default-style', self._NAMESPACES):
+            if defaultStyle.get(f'{{{self._NAMESPACES["style"]}}}family') == 'paragraph':
+                textProperties = defaultStyle.find('style:text-properties', self._NAMESPACES)
+                lngCode = textProperties.get(f'{{{self._NAMESPACES["fo"]}}}language')
+                ctrCode = textProperties.get(f'{{{self._NAMESPACES["fo"]}}}country')
+                self.handle_starttag('body', [('language', lngCode), ('country', ctrCode)])
+                break
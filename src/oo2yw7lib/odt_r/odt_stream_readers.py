@@ -0,0 +1,65 @@
+"""Provide ODT reader classes that parse the documents while unzipping.
+
+The document-specific handling is inherited from the pywriter reader classes.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.odt_r.odt_r_proof import OdtRProof
+from pywriter.odt_r.odt_r_manuscript import OdtRManuscript
+from pywriter.odt_r.odt_r_notes import OdtRNotes
+from pywriter.odt_r.odt_r_todo import OdtRTodo
+from pywriter.odt_r.odt_r_outline import OdtROutline
+from pywriter.odt_r.odt_r_scenedesc import OdtRSceneDesc
+from pywriter.odt_r.odt_r_chapterdesc import OdtRChapterDesc
+from pywriter.odt_r.odt_r_partdesc import OdtRPartDesc
+from pywriter.odt_r.odt_r_characters import OdtRCharacters
+from pywriter.odt_r.odt_r_locations import OdtRLocations
+from pywriter.odt_r.odt_r_items import OdtRItems
+from oo2yw7lib.odt_r.odt_stream_reader import OdtStreamReader
+from oo2yw7lib.odt_r.odt_stream_formatted import OdtStreamFormatted
+
+
+class StreamOdtRProof(OdtStreamFormatted, OdtRProof):
+    """ODT proof reader parsing the document while unzipping."""
+
+
+class StreamOdtRManuscript(OdtStreamFormatted, OdtRManuscript):
+    """ODT manuscript reader parsing the document while unzipping."""
+
+
+class StreamOdtRNotes(OdtStreamFormatted, OdtRNotes):
+    """ODT "Notes" chapters reader parsing the document while unzipping."""
+
+
+class StreamOdtRTodo(OdtStreamFormatted, OdtRTodo):
+    """ODT "Todo" chapters reader parsing the document while unzipping."""
+
+
+class StreamOdtROutline(OdtStreamReader, OdtROutline):
+    """ODT outline reader parsing the document while unzipping."""
+
+
+class StreamOdtRSceneDesc(OdtStreamReader, OdtRSceneDesc):
+    """ODT scene summaries reader parsing the document while unzipping."""
+
+
+class StreamOdtRChapterDesc(OdtStreamReader, OdtRChapterDesc):
+    """ODT chapter summaries reader parsing the document while unzipping."""
+
+
+class StreamOdtRPartDesc(OdtStreamReader, OdtRPartDesc):
+    """ODT part summaries reader parsing the document while unzipping."""
+
+
+class StreamOdtRCharacters(OdtStreamReader, OdtRCharacters):
+    """ODT character descriptions reader parsing the document while unzipping."""
+
+
+class StreamOdtRLocations(OdtStreamReader, OdtRLocations):
+    """ODT location descriptions reader parsing the document while unzipping."""
+
+
+class StreamOdtRItems(OdtStreamReader, OdtRItems):
+    """ODT item descriptions reader parsing the document while unzipping."""
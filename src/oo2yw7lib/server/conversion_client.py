@@ -0,0 +1,166 @@
+"""Provide a class for sending conversion requests to the oo2yw7 conversion server.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import socket
+from pywriter.pywriter_globals import *
+from oo2yw7lib.server.server_info import ServerInfo
+from oo2yw7lib.server.server_connection import ServerConnection
+
+
+class ConversionClient:
+    """Let a running conversion server do the work.
+
+    Public methods:
+        convert(sourcePath, ui) -- Let the server convert a document. Return False if no server is running.
+        ping() -- Return True if a server is running.
+        stop() -- Ask the server to stop. Return True if a server was running.
+
+    Public instance variables:
+        info -- ServerInfo instance.
+
+    The server shows nothing by itself.
+    Messages and questions come back to the client, which uses its own UI.
+    A server is considered not running if there is no server info file,
+    if the server process is gone, or if its port refuses the connection. 
+    Only then the caller is expected to do the work in-process. 
+    Once connected, the client waits a limited time until the server accepts the request, 
+    because the server processes requests one after another.
+    After acceptance, there is no time limit, because the server may wait for the user's answer.
+    """
+    _CONNECT_TIMEOUT = 5
+    # Seconds to wait for the connection.
+    # On Windows, a closed localhost port refuses the connection only after about two seconds.
+    _ACCEPT_TIMEOUT = 60
+    # Seconds to wait for the server to accept a request.
+
+    def __init__(self, info=None):
+        """Set the server info.
+
+        Optional arguments:
+            info -- ServerInfo instance. Default: the user's server info file.
+        """
+        if info is None:
+            info = ServerInfo()
+        self.info = info
+
+    def convert(self, sourcePath, ui):
+        """Let the server convert a document. Return False if no server is running.
+
+        Positional arguments:
+            sourcePath -- str: path of the odt/ods document.
+            ui -- Ui instance that shows the server's messages and asks its questions.
+
+        If False is returned, nothing has been converted.
+        If True is returned, the result or the error has been shown with the ui.
+        """
+        try:
+            connection = self._connect()
+        except OSError:
+            ui.set_info_how(f'!{_("The conversion server is not responding")}.')
+            return True
+
+        if connection is None:
+            return False
+
+        try:
+            try:
+                accepted = self._request(connection, 'convert', sourcePath=os.path.abspath(sourcePath))
+            except socket.timeout:
+                ui.set_info_how(f'!{_("The conversion server is not responding")}.')
+                return True
+
+            if not accepted:
+                ui.set_info_how(f'!{_("The conversion server rejected the request")}.')
+                return True
+
+            while True:
+                message = connection.receive()
+                if 'ask' in message:
+                    connection.send(answer=bool(ui.ask_yes_no(message['ask'])))
+                elif 'warning' in message:
+                    ui.show_warning(message['warning'])
+                elif 'info' in message:
+                    ui.set_info_how(message['info'])
+                elif message.get('done', False):
+                    break
+
+        except (OSError, ValueError):
+            ui.set_info_how(f'!{_("Connection to the conversion server lost")}.')
+        finally:
+            connection.close()
+        return True
+
+    def ping(self):
+        """Return True if a server is running.
+        
+        If the server is busy, wait a limited time until it accepts the request.
+        """
+        return self._send_command('ping')
+
+    def stop(self):
+        """Ask the server to stop. Return True if a server was running.
+        
+        If the server is busy, wait a limited time until it accepts the request.
+        """
+        return self._send_command('stop')
+
+    def _connect(self):
+        """Return a connection to the server, or None if no server is running.
+
+        Raise an OSError exception if the server cannot be reached otherwise.
+        """
+        if not self.info.read():
+            return None
+
+        if not self.info.is_alive():
+            return None
+
+        try:
+            sock = socket.create_connection((self.info.HOST, self.info.port), timeout=self._CONNECT_TIMEOUT)
+        except ConnectionRefusedError:
+            return None
+
+        sock.settimeout(self._ACCEPT_TIMEOUT)
+        return ServerConnection(sock)
+
+    def _request(self, connection, command, **kwargs):
+        """Send a request, and wait until the server accepts it. Return True on acceptance.
+
+        The request is sent only when the server is ready for it,
+        so a request given up on while the server is busy is never processed later.
+        After acceptance, wait for further messages without a time limit.
+        Raise a socket.timeout exception if the server does not answer in time,
+        and an OSError or ValueError exception if the connection is broken.
+        """
+        if connection.receive().get('ready', False) is not True:
+            return False
+
+        connection.send(command=command, token=self.info.token, **kwargs)
+        if connection.receive().get('accepted', False) is not True:
+            return False
+
+        connection.settimeout(None)
+        return True
+
+    def _send_command(self, command):
+        """Send a request without further messages. Return True if the server accepted it."""
+        try:
+            connection = self._connect()
+        except OSError:
+            return False
+
+        if connection is None:
+            return False
+
+        try:
+            return self._request(connection, command)
+
+        except (OSError, ValueError):
+            return False
+
+        finally:
+            connection.close()
@@ -0,0 +1,114 @@
+"""Provide a class for the resident oo2yw7 conversion server.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import hmac
+import socket
+import secrets
+from pywriter.pywriter_globals import *
+from oo2yw7lib.converter.oo2yw7_importer import Oo2yw7Importer
+from oo2yw7lib.server.conversion_client import ConversionClient
+from oo2yw7lib.server.server_connection import ServerConnection
+from oo2yw7lib.server.server_info import ServerInfo
+from oo2yw7lib.ui.ui_remote import UiRemote
+
+
+class ConversionServer:
+    """Resident server that converts documents on behalf of local clients.
+
+    Public methods:
+        serve() -- Process requests until stopped, or idle for too long.
+
+    Public instance variables:
+        converter -- Oo2yw7Importer instance used for all conversions.
+        info -- ServerInfo instance.
+        idleTimeout -- float: seconds without requests before the server stops, or None.
+
+    The server listens on a localhost port chosen by the system.
+    Port and a random access token are published in the user's server info file.
+    Requests are processed one after another,
+    so two conversions never write to the same yw7 file at the same time.
+    The converter and all its modules stay loaded between the requests.
+    """
+    _CLIENT_TIMEOUT = 600
+    # Seconds to wait for a client's request or answer.
+
+    def __init__(self, idleTimeout=None, info=None):
+        """Set the server options.
+
+        Optional arguments:
+            idleTimeout -- float: seconds without requests before the server stops. Default: run until stopped.
+            info -- ServerInfo instance. Default: the user's server info file.
+        """
+        if info is None:
+            info = ServerInfo()
+        self.info = info
+        self.idleTimeout = idleTimeout
+        self.converter = Oo2yw7Importer()
+        self._running = False
+
+    def serve(self):
+        """Process requests until stopped, or idle for too long.
+
+        Raise the "Error" exception if another server is already running.
+        """
+        if ConversionClient(ServerInfo(self.info.filePath)).ping():
+            raise Error(f'{_("The conversion server is already running")}.')
+
+        token = secrets.token_hex(16)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind((self.info.HOST, 0))
+            listener.listen()
+            listener.settimeout(self.idleTimeout)
+            self.info.write(listener.getsockname()[1], token)
+            self._running = True
+            try:
+                while self._running:
+                    try:
+                        sock, __ = listener.accept()
+                    except socket.timeout:
+                        break
+
+                    sock.settimeout(self._CLIENT_TIMEOUT)
+                    connection = ServerConnection(sock)
+                    try:
+                        self._handle_request(connection, token)
+                    except Exception:
+                        # A broken request must not stop the server.
+                        pass
+                    finally:
+                        connection.close()
+            finally:
+                self._running = False
+                self.info.remove()
+
+    def _handle_request(self, connection, token):
+        """Process a single request.
+
+        Positional arguments:
+            connection -- ServerConnection instance.
+            token -- str: access token the request must contain.
+
+        Tell the client that the server is ready, before the request is sent.
+        """
+        connection.send(ready=True)
+        request = connection.receive()
+        if not hmac.compare_digest(str(request.get('token', '')), token):
+            connection.send(accepted=False)
+            return
+
+        command = request.get('command', None)
+        if command == 'ping':
+            connection.send(accepted=True)
+        elif command == 'stop':
+            self._running = False
+            connection.send(accepted=True)
+        elif command == 'convert':
+            connection.send(accepted=True)
+            self.converter.ui = UiRemote(connection)
+            self.converter.run(str(request['sourcePath']), suffix=None)
+            connection.send(done=True)
+        else:
+            connection.send(accepted=False)
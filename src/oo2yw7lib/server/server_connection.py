@@ -0,0 +1,68 @@
+"""Provide a class for the message stream between conversion server and client.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import json
+
+
+class ServerConnection:
+    """JSON messages over a socket connection.
+
+    Public methods:
+        send(**message) -- Send a message.
+        receive() -- Return the next message.
+        settimeout(timeout) -- Set the time limit for sending and receiving.
+        close() -- Close the connection.
+
+    Each message is a JSON object in a single line.
+    Raise an OSError exception if the connection is broken,
+    and a ValueError exception if a message cannot be decoded.
+    """
+
+    def __init__(self, sock):
+        """Wrap a connected socket.
+
+        Positional arguments:
+            sock -- connected socket.socket instance.
+        """
+        self._socket = sock
+        self._file = sock.makefile('rwb')
+
+    def send(self, **message):
+        """Send a message.
+
+        Arguments:
+            message -- the message's keys and values.
+        """
+        self._file.write(json.dumps(message).encode('utf-8') + b'\n')
+        self._file.flush()
+
+    def receive(self):
+        """Return the next message as a dictionary."""
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError('Connection closed')
+
+        message = json.loads(line.decode('utf-8'))
+        if not isinstance(message, dict):
+            raise ValueError('Invalid message')
+
+        return message
+
+    def settimeout(self, timeout):
+        """Set the time limit for sending and receiving.
+
+        Positional arguments:
+            timeout -- float: seconds, or None for no time limit.
+        """
+        self._socket.settimeout(timeout)
+
+    def close(self):
+        """Close the connection."""
+        try:
+            self._file.close()
+        except:
+            pass
+        self._socket.close()
@@ -0,0 +1,140 @@
+"""Provide a class for the address file of the oo2yw7 conversion server.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import json
+import ctypes
+
+
+class ServerInfo:
+    """Port and access token of the running conversion server.
+
+    Public methods:
+        read() -- Load the server info file. Return True on success.
+        is_alive() -- Return False if the server process is known to be gone.
+        write(port, token) -- Save the server info file.
+        remove() -- Delete the server info file, if it belongs to this server.
+
+    Public instance variables:
+        filePath -- str: path to the server info file.
+        port -- int: port number of the server, or None.
+        token -- str: access token of the server, or None.
+        pid -- int: process ID of the server, or None.
+
+    The file is located in the user's pywriter configuration directory.
+    Only the user can read it, so only the user's processes can send requests.
+    """
+    HOST = '127.0.0.1'
+
+    def __init__(self, filePath=None):
+        """Set the path of the server info file.
+
+        Optional arguments:
+            filePath -- str: path to the server info file. Default: file in the user's configuration directory.
+        """
+        if filePath is None:
+            filePath = f'{os.path.expanduser("~")}/.pywriter/oo2yw7/config/server.json'
+        self.filePath = filePath
+        self.port = None
+        self.token = None
+        self.pid = None
+
+    def read(self):
+        """Load the server info file. Return True on success.
+
+        A missing or corrupt file means that no server is running.
+        """
+        try:
+            with open(self.filePath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.port = int(data['port'])
+            self.token = str(data['token'])
+            self.pid = data.get('pid', None)
+            if self.pid is not None:
+                self.pid = int(self.pid)
+            return True
+
+        except:
+            return False
+
+    def is_alive(self):
+        """Return False if the server process is known to be gone.
+
+        A server info file left behind by a crashed server
+        may point to a port that now belongs to another process.
+        If the process ID is unknown, or cannot be checked, the server is assumed to be alive.
+        """
+        if self.pid is None:
+            return True
+
+        if os.name == 'nt':
+            # On Windows, os.kill() would terminate the process.
+            return self._is_alive_windows()
+
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+
+        except:
+            pass
+        return True
+
+    def write(self, port, token):
+        """Save the server info file.
+
+        Positional arguments:
+            port -- int: port number of the server.
+            token -- str: access token of the server.
+
+        The file is written under a temporary name and then moved into place.
+        Raise an OSError exception if the file cannot be written.
+        """
+        self.port = port
+        self.token = token
+        self.pid = os.getpid()
+        os.makedirs(os.path.dirname(self.filePath), mode=0o700, exist_ok=True)
+        tempPath = f'{self.filePath}.tmp'
+        with os.fdopen(os.open(tempPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump(dict(port=port, token=token, pid=self.pid), f)
+        os.replace(tempPath, self.filePath)
+
+    def remove(self):
+        """Delete the server info file, if it belongs to this server.
+
+        A file written by another server is left untouched.
+        """
+        myToken = self.token
+        if myToken is None:
+            return
+
+        try:
+            if self.read() and self.token == myToken:
+                os.remove(self.filePath)
+        except:
+            pass
+
+    def _is_alive_windows(self):
+        """Return False if the Windows process with the server's process ID is gone."""
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        ERROR_INVALID_PARAMETER = 87
+        STILL_ACTIVE = 259
+        try:
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, self.pid)
+            if not handle:
+                return ctypes.get_last_error() != ERROR_INVALID_PARAMETER
+
+            try:
+                exitCode = ctypes.c_ulong()
+                if kernel32.GetExitCodeProcess(handle, ctypes.byref(exitCode)):
+                    return exitCode.value == STILL_ACTIVE
+
+            finally:
+                kernel32.CloseHandle(handle)
+        except:
+            pass
+        return True
@@ -0,0 +1,60 @@
+"""Provide a non-interactive UI class for batch processing.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.ui.ui import Ui
+
+
+class UiBatch(Ui):
+    """UI subclass that collects messages instead of showing them.
+    
+    Public methods:
+        set_info_how(message) -- Store a message about the conversion result.
+        show_warning(message) -- Store a warning message.
+        reset() -- Discard all messages of the previous conversion.
+
+    Public instance variables:
+        warnings -- list of str: warnings of the current conversion.
+    
+    Questions are answered with "yes", so existing files are overwritten.
+    """
+
+    def __init__(self, title=''):
+        """Initialize the message buffers.
+        
+        Optional arguments:
+            title -- application title (ignored).
+        
+        Extends the superclass constructor.
+        """
+        super().__init__(title)
+        self.warnings = []
+
+    def set_info_how(self, message):
+        """Store a message about the conversion result.
+        
+        Positional arguments:
+            message -- message text.
+
+        Overrides the superclass method, 
+        because error messages must not be written to stderr.
+        """
+        self.infoHowText = message
+
+    def show_warning(self, message):
+        """Store a warning message.
+        
+        Positional arguments:
+            message -- message text.
+
+        Overrides the superclass method.
+        """
+        self.warnings.append(message)
+
+    def reset(self):
+        """Discard all messages of the previous conversion."""
+        self.infoWhatText = ''
+        self.infoHowText = ''
+        self.warnings = []
@@ -0,0 +1,80 @@
+"""Provide a UI class with message boxes that loads tkinter only when needed.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.ui.ui import Ui
+
+
+class UiLazyMb(Ui):
+    """UI subclass with message boxes, importing tkinter at the first message box.
+    
+    Public methods:
+        ask_yes_no(text) -- query yes or no with a pop-up box.
+        set_info_how(message) -- show a pop-up message.
+        show_warning(message) -- show a warning message box.
+
+    Public instance variables:
+        title -- str: application title.
+
+    Unlike pywriter's UiMb class, this class neither imports tkinter 
+    nor creates a Tk root window before a message box is actually shown.
+    """
+
+    def __init__(self, title):
+        """Initialize the title.
+        
+        Positional arguments:
+            title -- application title to be displayed at the window frame.
+        
+        Extends the superclass constructor.
+        """
+        super().__init__(title)
+        self.title = title
+        self._messagebox = None
+
+    def ask_yes_no(self, text):
+        """Query yes or no with a pop-up box.
+        
+        Positional arguments:
+            text -- question to be asked in the pop-up box. 
+            
+        Overrides the superclass method.       
+        """
+        return self._get_messagebox().askyesno(self.title, text)
+
+    def set_info_how(self, message):
+        """Show a pop-up message.
+        
+        Positional arguments:
+            message -- message to be displayed in the pop-up box. 
+            
+        If message starts with "!", show an error box.
+        Overrides the superclass method.
+        """
+        if message.startswith('!'):
+            message = message.split('!', maxsplit=1)[1].strip()
+            self._get_messagebox().showerror(self.title, message)
+        else:
+            self._get_messagebox().showinfo(self.title, message)
+
+    def show_warning(self, message):
+        """Show a warning message box.
+        
+        Positional arguments:
+            message -- warning message to be displayed in the pop-up box. 
+            
+        Overrides the superclass method.       
+        """
+        self._get_messagebox().showwarning(self.title, message)
+
+    def _get_messagebox(self):
+        """Return the tkinter messagebox module, creating a hidden root window at the first call."""
+        if self._messagebox is None:
+            import tkinter as tk
+            from tkinter import messagebox
+            root = tk.Tk()
+            root.withdraw()
+            self._messagebox = messagebox
+        return self._messagebox
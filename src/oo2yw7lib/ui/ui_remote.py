@@ -0,0 +1,67 @@
+"""Provide a UI class that passes messages and questions on to a conversion client.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+from pywriter.ui.ui import Ui
+
+
+class UiRemote(Ui):
+    """UI subclass for the conversion server.
+    
+    Public methods:
+        ask_yes_no(text) -- Let the client ask the user, and return the answer.
+        set_info_how(message) -- Pass a message about the conversion result on to the client.
+        show_warning(message) -- Pass a warning message on to the client.
+
+    The client shows the messages and asks the questions with its own UI.
+    If the client does not answer, questions are answered with "no".
+    """
+
+    def __init__(self, connection):
+        """Initialize the connection to the client.
+        
+        Positional arguments:
+            connection -- ServerConnection instance.
+        
+        Extends the superclass constructor.
+        """
+        super().__init__('')
+        self._connection = connection
+
+    def ask_yes_no(self, text):
+        """Let the client ask the user, and return the answer.
+        
+        Positional arguments:
+            text -- question to be asked. 
+            
+        Overrides the superclass method.       
+        """
+        self._connection.send(ask=text)
+        try:
+            return self._connection.receive().get('answer', False) is True
+
+        except (OSError, ValueError):
+            return False
+
+    def set_info_how(self, message):
+        """Pass a message about the conversion result on to the client.
+        
+        Positional arguments:
+            message -- message text, starting with "!" in case of error.
+            
+        Overrides the superclass method.       
+        """
+        self.infoHowText = message
+        self._connection.send(info=message)
+
+    def show_warning(self, message):
+        """Pass a warning message on to the client.
+        
+        Positional arguments:
+            message -- warning message text.
+            
+        Overrides the superclass method.       
+        """
+        self._connection.send(warning=message)
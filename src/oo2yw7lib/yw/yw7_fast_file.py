@@ -0,0 +1,598 @@
+"""Provide a class for yWriter 7 project import and export with a one-pass writer.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+from datetime import datetime
+from pywriter.pywriter_globals import *
+from pywriter.model.character import Character
+from pywriter.model.world_element import WorldElement
+from pywriter.model.novel import LANGUAGE_TAG
+from pywriter.yw.yw7_file import Yw7File
+from oo2yw7lib.model.lazy_scene import LazyScene
+from oo2yw7lib.model.compact_chapter import CompactChapter
+from oo2yw7lib.converter.phase_timer import PhaseTimer
+
+
+class Yw7FastFile(Yw7File):
+    """yWriter 7 project file representation.
+
+    Public methods: 
+        write() -- Write instance variables to the yWriter xml file.
+
+    Public instance variables:
+        phaseTimer -- PhaseTimer instance measuring the "build tree" and "serialize" phases of writing.
+
+    When reading, the subelements of each project element are indexed by tag in a single pass.
+    Scenes and chapters are represented by compact objects, 
+    and the scenes' word and letter counts are computed on demand.
+
+    The xml file is written in the yWriter dialect in a single pass, 
+    instead of being written by ElementTree and then read, modified, and written again.
+    The output is the same as the superclass's output.
+    The file is written under a temporary name and then moved into place, 
+    so a half-written project file never replaces a complete one.
+    """
+    _XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n'
+    _TEMP_EXTENSION = '.tmp'
+
+    def __init__(self, filePath, **kwargs):
+        """Initialize instance variables.
+
+        Positional arguments:
+            filePath -- str: path to the yw7 file.
+            
+        Optional arguments:
+            kwargs -- keyword arguments (not used here).            
+        
+        Extends the superclass constructor.
+        """
+        super().__init__(filePath, **kwargs)
+        self.phaseTimer = PhaseTimer()
+
+    def write(self):
+        """Write instance variables to the yWriter xml file.
+        
+        Open the yWriter xml file located at filePath and replace the instance variables 
+        not being None. Create new XML elements if necessary.
+        Raise the "Error" exception in case of error. 
+        Overrides the superclass method.
+        """
+        if self.is_locked():
+            raise Error(f'{_("yWriter seems to be open. Please close first")}.')
+
+        if self.novel.languages is None:
+            self._get_languages()
+
+        for scId in self.novel.scenes:
+            if self.novel.scenes[scId].scnArcs is not None:
+                self.novel.scenes[scId].kwVar['Field_SceneArcs'] = self.novel.scenes[scId].scnArcs
+            if self.novel.scenes[scId].scnStyle is not None:
+                self.novel.scenes[scId].kwVar['Field_SceneStyle'] = self.novel.scenes[scId].scnStyle
+
+        with self.phaseTimer.measure('build tree'):
+            self._build_element_tree()
+        with self.phaseTimer.measure('serialize'):
+            self._write_element_tree(self)
+
+    def _get_languages(self):
+        """Determine the languages used in the scenes.
+        
+        Scan each scene's text once and keep the languages in order of appearance.
+        This replaces the novel's get_languages() method, 
+        which searches the rest of the text again after each language tag.
+        """
+        languages = []
+        knownLanguages = set()
+        for scId in self.novel.scenes:
+            text = self.novel.scenes[scId].sceneContent
+            if text:
+                for language in LANGUAGE_TAG.findall(text):
+                    if not language in knownLanguages:
+                        knownLanguages.add(language)
+                        languages.append(language)
+        self.novel.languages = languages
+
+    def _get_subelements(self, xmlElement):
+        """Return a dictionary of subelements by tag, holding the first subelement of each tag.
+        
+        Positional arguments:
+            xmlElement -- xml element.
+        """
+        subelements = {}
+        for subelement in xmlElement:
+            if not subelement.tag in subelements:
+                subelements[subelement.tag] = subelement
+        return subelements
+
+    def _read_characters(self, root):
+        """Read characters from the xml element tree.
+        
+        Positional arguments:
+            root -- root element of the xml element tree.
+        
+        Overrides the superclass method.
+        """
+        self.novel.srtCharacters = []
+        for xmlCharacter in root.find('CHARACTERS'):
+            xml = self._get_subelements(xmlCharacter)
+            crId = xml['ID'].text
+            self.novel.srtCharacters.append(crId)
+            character = Character()
+            self.novel.characters[crId] = character
+            self._read_world_element(xmlCharacter, xml, character, self.CRT_KWVAR)
+
+            if 'Notes' in xml:
+                character.notes = xml['Notes'].text
+
+            if 'Bio' in xml:
+                character.bio = xml['Bio'].text
+
+            if 'Goals' in xml:
+                character.goals = xml['Goals'].text
+
+            if 'FullName' in xml:
+                character.fullName = xml['FullName'].text
+
+            character.isMajor = 'Major' in xml
+
+    def _read_chapters(self, root):
+        """Read chapters from the xml element tree.
+        
+        Positional arguments:
+            root -- root element of the xml element tree.
+        
+        Overrides the superclass method.
+        """
+        self.novel.srtChapters = []
+        for xmlChapter in root.find('CHAPTERS'):
+            xml = self._get_subelements(xmlChapter)
+            chId = xml['ID'].text
+            chapter = CompactChapter()
+            self.novel.chapters[chId] = chapter
+            self.novel.srtChapters.append(chId)
+
+            if 'Title' in xml:
+                chapter.title = xml['Title'].text
+
+            if 'Desc' in xml:
+                chapter.desc = xml['Desc'].text
+
+            if 'SectionStart' in xml:
+                chapter.chLevel = 1
+            else:
+                chapter.chLevel = 0
+
+            chapter.chType = 0
+            yUnused = 'Unused' in xml
+            if 'ChapterType' in xml:
+                yChapterType = xml['ChapterType'].text
+                if yChapterType == '2':
+                    chapter.chType = 2
+                elif yChapterType == '1':
+                    chapter.chType = 1
+                elif yUnused:
+                    chapter.chType = 3
+            elif 'Type' in xml:
+                yType = xml['Type'].text
+                if yType == '1':
+                    chapter.chType = 1
+                elif yUnused:
+                    chapter.chType = 3
+
+            chapter.suppressChapterTitle = False
+            if chapter.title is not None:
+                if chapter.title.startswith('@'):
+                    chapter.suppressChapterTitle = True
+
+            for fieldName in self.CHP_KWVAR:
+                chapter.kwVar[fieldName] = None
+
+            if 'Fields' in xml:
+                for xmlChapterFields in xmlChapter.findall('Fields'):
+                    fields = self._get_subelements(xmlChapterFields)
+                    if 'Field_SuppressChapterTitle' in fields:
+                        if fields['Field_SuppressChapterTitle'].text == '1':
+                            chapter.suppressChapterTitle = True
+                    chapter.isTrash = False
+                    if 'Field_IsTrash' in fields:
+                        if fields['Field_IsTrash'].text == '1':
+                            chapter.isTrash = True
+                    chapter.suppressChapterBreak = False
+                    if 'Field_SuppressChapterBreak' in fields:
+                        if fields['Field_SuppressChapterBreak'].text == '1':
+                            chapter.suppressChapterBreak = True
+
+                    for fieldName in self.CHP_KWVAR:
+                        if fieldName in fields:
+                            chapter.kwVar[fieldName] = fields[fieldName].text
+
+            chapter.srtScenes = []
+            if 'Scenes' in xml:
+                for scn in xml['Scenes'].findall('ScID'):
+                    scId = scn.text
+                    if scId in self.novel.scenes:
+                        chapter.srtScenes.append(scId)
+
+    def _read_items(self, root):
+        """Read items from the xml element tree.
+        
+        Positional arguments:
+            root -- root element of the xml element tree.
+        
+        Overrides the superclass method.
+        """
+        self.novel.srtItems = []
+        for xmlItem in root.find('ITEMS'):
+            xml = self._get_subelements(xmlItem)
+            itId = xml['ID'].text
+            self.novel.srtItems.append(itId)
+            self.novel.items[itId] = WorldElement()
+            self._read_world_element(xmlItem, xml, self.novel.items[itId], self.ITM_KWVAR)
+
+    def _read_locations(self, root):
+        """Read locations from the xml element tree.
+        
+        Positional arguments:
+            root -- root element of the xml element tree.
+        
+        Overrides the superclass method.
+        """
+        self.novel.srtLocations = []
+        for xmlLocation in root.find('LOCATIONS'):
+            xml = self._get_subelements(xmlLocation)
+            lcId = xml['ID'].text
+            self.novel.srtLocations.append(lcId)
+            self.novel.locations[lcId] = WorldElement()
+            self._read_world_element(xmlLocation, xml, self.novel.locations[lcId], self.LOC_KWVAR)
+
+    def _read_scenes(self, root):
+        """Read scenes from the xml element tree.
+        
+        Positional arguments:
+            root -- root element of the xml element tree.
+        
+        The scenes' word count and letter count are computed when needed,
+        so the counts stored in the project file are not used.
+        Overrides the superclass method.
+        """
+        characters = set(self.novel.srtCharacters)
+        locations = set(self.novel.srtLocations)
+        items = set(self.novel.srtItems)
+        for xmlScene in root.find('SCENES'):
+            xml = self._get_subelements(xmlScene)
+            scId = xml['ID'].text
+            scene = LazyScene()
+            self.novel.scenes[scId] = scene
+
+            if 'Title' in xml:
+                scene.title = xml['Title'].text
+
+            if 'Desc' in xml:
+                scene.desc = xml['Desc'].text
+
+            if 'SceneContent' in xml:
+                sceneContent = xml['SceneContent'].text
+                if sceneContent is not None:
+                    scene.sceneContent = sceneContent
+
+            scene.scType = 0
+
+            for fieldName in self.SCN_KWVAR:
+                scene.kwVar[fieldName] = None
+
+            if 'Fields' in xml:
+                for xmlSceneFields in xmlScene.findall('Fields'):
+                    fields = self._get_subelements(xmlSceneFields)
+                    for fieldName in self.SCN_KWVAR:
+                        if fieldName in fields:
+                            scene.kwVar[fieldName] = fields[fieldName].text
+
+                    if 'Field_SceneType' in fields:
+                        ySceneType = fields['Field_SceneType'].text
+                        if ySceneType == '1':
+                            scene.scType = 1
+                        elif ySceneType == '2':
+                            scene.scType = 2
+            if 'Unused' in xml:
+                if scene.scType == 0:
+                    scene.scType = 3
+
+            if not 'ExportCondSpecific' in xml:
+                scene.doNotExport = False
+            elif 'ExportWhenRTF' in xml:
+                scene.doNotExport = False
+            else:
+                scene.doNotExport = True
+
+            if 'Status' in xml:
+                scene.status = int(xml['Status'].text)
+
+            if 'Notes' in xml:
+                scene.notes = xml['Notes'].text
+
+            if 'Tags' in xml:
+                if xml['Tags'].text is not None:
+                    tags = string_to_list(xml['Tags'].text)
+                    scene.tags = self._strip_spaces(tags)
+
+            if 'Field1' in xml:
+                scene.field1 = xml['Field1'].text
+
+            if 'Field2' in xml:
+                scene.field2 = xml['Field2'].text
+
+            if 'Field3' in xml:
+                scene.field3 = xml['Field3'].text
+
+            if 'Field4' in xml:
+                scene.field4 = xml['Field4'].text
+
+            scene.appendToPrev = 'AppendToPrev' in xml
+
+            if 'SpecificDateTime' in xml:
+                dateTimeStr = xml['SpecificDateTime'].text
+
+                try:
+                    dateTime = datetime.fromisoformat(dateTimeStr)
+                except:
+                    scene.date = ''
+                    scene.time = ''
+                else:
+                    startDateTime = dateTime.isoformat().split('T')
+                    scene.date = startDateTime[0]
+                    scene.time = startDateTime[1]
+            else:
+                if 'Day' in xml:
+                    day = xml['Day'].text
+
+                    try:
+                        int(day)
+                    except ValueError:
+                        day = ''
+                    scene.day = day
+
+                hasUnspecificTime = False
+                if 'Hour' in xml:
+                    hour = xml['Hour'].text.zfill(2)
+                    hasUnspecificTime = True
+                else:
+                    hour = '00'
+                if 'Minute' in xml:
+                    minute = xml['Minute'].text.zfill(2)
+                    hasUnspecificTime = True
+                else:
+                    minute = '00'
+                if hasUnspecificTime:
+                    scene.time = f'{hour}:{minute}:00'
+
+            if 'LastsDays' in xml:
+                scene.lastsDays = xml['LastsDays'].text
+
+            if 'LastsHours' in xml:
+                scene.lastsHours = xml['LastsHours'].text
+
+            if 'LastsMinutes' in xml:
+                scene.lastsMinutes = xml['LastsMinutes'].text
+
+            scene.isReactionScene = 'ReactionScene' in xml
+            scene.isSubPlot = 'SubPlot' in xml
+
+            if 'Goal' in xml:
+                scene.goal = xml['Goal'].text
+
+            if 'Conflict' in xml:
+                scene.conflict = xml['Conflict'].text
+
+            if 'Outcome' in xml:
+                scene.outcome = xml['Outcome'].text
+
+            if 'ImageFile' in xml:
+                scene.image = xml['ImageFile'].text
+
+            if 'Characters' in xml:
+                for xmlCharacter in xml['Characters'].iter('CharID'):
+                    crId = xmlCharacter.text
+                    if crId in characters:
+                        if scene.characters is None:
+                            scene.characters = []
+                        scene.characters.append(crId)
+
+            if 'Locations' in xml:
+                for xmlLocation in xml['Locations'].iter('LocID'):
+                    lcId = xmlLocation.text
+                    if lcId in locations:
+                        if scene.locations is None:
+                            scene.locations = []
+                        scene.locations.append(lcId)
+
+            if 'Items' in xml:
+                for xmlItem in xml['Items'].iter('ItemID'):
+                    itId = xmlItem.text
+                    if itId in items:
+                        if scene.items is None:
+                            scene.items = []
+                        scene.items.append(itId)
+
+    def _read_world_element(self, xmlElement, xml, element, kwVarFields):
+        """Read the data that characters, locations, and items have in common.
+        
+        Positional arguments:
+            xmlElement -- xml element of the character, location, or item.
+            xml -- dictionary of the xml element's subelements by tag.
+            element -- WorldElement or Character instance.
+            kwVarFields -- list of the names of the element type's custom fields.
+        """
+        if 'Title' in xml:
+            element.title = xml['Title'].text
+
+        if 'ImageFile' in xml:
+            element.image = xml['ImageFile'].text
+
+        if 'Desc' in xml:
+            element.desc = xml['Desc'].text
+
+        if 'AKA' in xml:
+            element.aka = xml['AKA'].text
+
+        if 'Tags' in xml:
+            if xml['Tags'].text is not None:
+                tags = string_to_list(xml['Tags'].text)
+                element.tags = self._strip_spaces(tags)
+
+        for fieldName in kwVarFields:
+            element.kwVar[fieldName] = None
+
+        if 'Fields' in xml:
+            for xmlFields in xmlElement.findall('Fields'):
+                fields = self._get_subelements(xmlFields)
+                for fieldName in kwVarFields:
+                    if fieldName in fields:
+                        element.kwVar[fieldName] = fields[fieldName].text
+
+    def _write_element_tree(self, ywProject):
+        """Write the yWriter xml file, then replace the existing file.
+        
+        Positional arguments:
+            ywProject -- Yw7File instance with the element tree to write.
+            
+        Keep the previous project file as backup.
+        Raise the "Error" exception in case of error. 
+        Overrides the superclass method.
+        """
+        tempPath = f'{ywProject.filePath}{self._TEMP_EXTENSION}'
+        try:
+            with open(tempPath, 'w', encoding='utf-8') as f:
+                f.write(self._XML_HEADER)
+                self._write_element(f.write, ywProject.tree.getroot(), 0)
+        except:
+            try:
+                os.remove(tempPath)
+            except:
+                pass
+            raise Error(f'{_("Cannot write file")}: "{norm_path(ywProject.filePath)}".')
+
+        backedUp = False
+        if os.path.isfile(ywProject.filePath):
+            try:
+                os.replace(ywProject.filePath, f'{ywProject.filePath}.bak')
+            except:
+                try:
+                    os.remove(tempPath)
+                except:
+                    pass
+                raise Error(f'{_("Cannot overwrite file")}: "{norm_path(ywProject.filePath)}".')
+            else:
+                backedUp = True
+        try:
+            os.replace(tempPath, ywProject.filePath)
+        except:
+            try:
+                if backedUp:
+                    os.replace(f'{ywProject.filePath}.bak', ywProject.filePath)
+                os.remove(tempPath)
+            except:
+                pass
+            raise Error(f'{_("Cannot write file")}: "{norm_path(ywProject.filePath)}".')
+
+    def _write_element(self, write, elem, level):
+        """Write an xml element with its subelements and its tail.
+        
+        Positional arguments:
+            write -- write method of the output file.
+            elem -- xml element to write.
+            level -- int: nesting level of the element.
+        
+        The project's top level sections are written piece by piece. 
+        Their subelements, e.g. scenes, are serialized as a whole before writing.
+        """
+        if level < 2 and len(elem):
+            start, text, end = self._get_tags(elem)
+            write(self._clean_up(f'{start}{text}'))
+            for subelement in elem:
+                self._write_element(write, subelement, level + 1)
+            write(self._clean_up(f'{end}{self._normalize(elem.tail)}'))
+        else:
+            parts = []
+            self._serialize(parts, elem)
+            write(self._clean_up(''.join(parts)))
+
+    def _serialize(self, parts, elem):
+        """Add an xml element with its subelements and its tail to a list of strings.
+        
+        Positional arguments:
+            parts -- list of str: the serialized xml.
+            elem -- xml element to serialize.
+        """
+        if elem.text or len(elem):
+            start, text, end = self._get_tags(elem)
+            parts.append(start)
+            parts.append(text)
+            for subelement in elem:
+                self._serialize(parts, subelement)
+            parts.append(end)
+        elif elem.tag == 'CHAPTERS' and not self.novel.chapters:
+            parts.append('<CHAPTERS></CHAPTERS>')
+        else:
+            parts.append(f'<{elem.tag}{self._get_attributes(elem)} />')
+        if elem.tail:
+            parts.append(self._normalize(elem.tail))
+
+    def _get_tags(self, elem):
+        """Return a tuple of start tag, normalized text, and end tag.
+        
+        Positional arguments:
+            elem -- xml element, not empty.
+
+        Put the text of the elements listed in _CDATA_TAGS into a CDATA section.
+        """
+        attributes = self._get_attributes(elem)
+        start = f'<{elem.tag}{attributes}>'
+        end = f'</{elem.tag}>'
+        if elem.tag in self._CDATA_TAGS:
+            if not attributes:
+                start = f'{start}<![CDATA['
+            end = f']]>{end}'
+        return start, self._normalize(elem.text), end
+
+    def _get_attributes(self, elem):
+        """Return the element's attributes as a string.
+        
+        yWriter project files have no attributes, 
+        so the values are not normalized.
+        """
+        attributes = []
+        for key, value in elem.items():
+            attributes.append(f' {key}="{value}"')
+        return ''.join(attributes)
+
+    def _clean_up(self, text):
+        """Return text without whitespace at the inner boundaries of the CDATA sections.
+        
+        Positional arguments:
+            text -- str: serialized xml.
+
+        The replacement is done globally, as the superclass does when postprocessing. 
+        """
+        if '[CDATA[ \n' in text:
+            text = text.replace('[CDATA[ \n', '[CDATA[')
+        if '\n]]' in text:
+            text = text.replace('\n]]', ']]')
+        return text
+
+    def _normalize(self, text):
+        """Return text with universal line breaks.
+        
+        Positional arguments:
+            text -- str or None.
+        
+        The text is neither escaped nor put into a CDATA section. 
+        """
+        if not text:
+            return ''
+
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
@@ -1,4 +1,4 @@
-from oo2yw7 import main
+from oo2yw7_client import main
 import sys
 
 try:
@@ -0,0 +1,46 @@
+"""Regression test for the inline tag merging of the formatted ODT readers.
+
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import unittest
+TEST_PATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, f'{TEST_PATH}/../../PyWriter/src')
+sys.path.insert(0, f'{TEST_PATH}/../src')
+from pywriter.model.novel import Novel
+from pywriter.odt_r.odt_r_formatted import OdtRFormatted
+from oo2yw7lib.odt_r.odt_stream_r_import import StreamOdtRImport
+
+
+class MergeTags(unittest.TestCase):
+    """Test case: Merge adjacent runs of the same inline tag."""
+
+    def setUp(self):
+        self.reader = StreamOdtRImport('test.odt')
+        self.reader.novel = Novel()
+        self.reader.novel.languages = ['de']
+
+    def test_adjacent_tags(self):
+        self.assertEqual(self.reader._cleanup_scene('[i]one[/i][i]two[/i]'), '[i]onetwo[/i]')
+        self.assertEqual(self.reader._cleanup_scene('[b]one[/b]\n[b]two[/b]'), '[b]one\ntwo[/b]')
+        self.assertEqual(self.reader._cleanup_scene('[i]one[/i]\n> [i]two[/i]'), '[i]one\n> two[/i]')
+
+    def test_nested_tags(self):
+        # pywriter merges the inner tags only if they are processed first.
+        text = '[b][i]one[/i][/b][b][i]two[/i][/b]'
+        self.assertEqual(OdtRFormatted._cleanup_scene(self.reader, text), '[b][i]one[/i][i]two[/i][/b]')
+        self.assertEqual(self.reader._cleanup_scene(text), '[b][i]onetwo[/i][/b]')
+
+    def test_nested_tags_with_line_break(self):
+        text = '[lang=de][i]one[/i]\n[/lang=de][lang=de][i]two[/i][/lang=de]'
+        self.assertEqual(self.reader._cleanup_scene(text), '[lang=de][i]one\ntwo[/i][/lang=de]')
+
+    def test_different_tags(self):
+        text = '[i]one[/i][b]two[/b] [lang=de]three[/lang=de][lang=fr]four[/lang=fr]'
+        self.assertEqual(self.reader._cleanup_scene(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
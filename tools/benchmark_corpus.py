@@ -0,0 +1,382 @@
+"""Generate a synthetic corpus for benchmarking the oo2yw7 conversions.
+
+Usage:
+benchmark_corpus.py directory [words] [scenes]
+
+Write a yWriter project of the given size (default: 100000 words in 500 scenes),
+and documents belonging to it:
+- bench_manuscript.odt -- editable manuscript,
+- bench_proof.odt -- tagged manuscript for proofing,
+- bench_scenes.odt -- scene descriptions,
+- bench_scenelist.ods -- scene list,
+- bench_charlist.ods -- character list,
+- bench_loclist.ods -- location list,
+- bench_itemlist.ods -- item list,
+- outline.odt -- novel outline for a new project.
+
+The documents have the same structure as the project, but different texts,
+so that importing a document changes the project.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import random
+import zipfile
+from xml.sax.saxutils import escape
+sys.path.insert(0, f'{os.getcwd()}/../../PyWriter/src')
+from pywriter.model.novel import Novel
+from pywriter.model.chapter import Chapter
+from pywriter.model.scene import Scene
+from pywriter.model.character import Character
+from pywriter.model.world_element import WorldElement
+from pywriter.yw.yw7_file import Yw7File
+
+WORDS_PER_PARAGRAPH = 50
+SCENES_PER_CHAPTER = 10
+SCENES_PER_CHARACTER = 10
+SCENES_PER_LOCATION = 20
+SCENES_PER_ITEM = 20
+LANGUAGE = ('fr', 'FR')
+VOCABULARY = ['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit',
+              'sed', 'do', 'eiusmod', 'tempor', 'incididunt', 'ut', 'labore', 'et', 'dolore']
+ODF_NAMESPACES = ('xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+                  'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+                  'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+                  'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+                  'xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0" '
+                  'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+                  'xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0"')
+ODT_AUTOMATIC_STYLES = ('<office:automatic-styles><style:style style:name="T1" style:family="text">'
+                        f'<style:text-properties fo:language="{LANGUAGE[0]}" fo:country="{LANGUAGE[1]}"/>'
+                        '</style:style></office:automatic-styles>')
+SCENE_LIST_COLUMNS = 21
+CHARACTER_LIST_COLUMNS = 10
+ELEMENT_LIST_COLUMNS = 5
+
+
+def make_novel_data(words, scenes, seed):
+    """Return a dictionary with the synthetic novel's elements.
+
+    Positional arguments:
+        words -- int: total number of words in the scenes.
+        scenes -- int: number of scenes.
+        seed -- int: the same seed produces the same texts.
+
+    The IDs and the structure depend only on the size.
+    Paragraphs are lists of (format, text) tuples,
+    where format is None, "i" for italics, or "lang" for the second language.
+    """
+    randomizer = random.Random(seed)
+
+    def text(wordCount):
+        return ' '.join(randomizer.choices(VOCABULARY, k=wordCount))
+
+    def paragraph(wordCount, index):
+        segments = [(None, f'{text(max(1, wordCount - 4))} '), ('i', text(1))]
+        if index % 5 == 0:
+            segments.append((None, ' '))
+            segments.append(('lang', text(3)))
+        return segments
+
+    scenes = max(1, scenes)
+    wordsPerScene = max(1, words // scenes)
+    data = dict(chapters=[], characters=[], locations=[], items=[])
+    for i in range(max(1, scenes // SCENES_PER_CHARACTER)):
+        data['characters'].append(dict(id=str(i + 1), title=text(1).title(), fullName=text(2).title(),
+                                       desc=text(20), bio=text(20), goals=text(10), isMajor=i < 3))
+    for elementType, scenesPerElement in (('locations', SCENES_PER_LOCATION), ('items', SCENES_PER_ITEM)):
+        for i in range(max(1, scenes // scenesPerElement)):
+            data[elementType].append(dict(id=str(i + 1), title=text(2).title(), desc=text(20), aka=text(1)))
+    for scIndex in range(scenes):
+        if scIndex % SCENES_PER_CHAPTER == 0:
+            chNumber = len(data['chapters']) + 1
+            data['chapters'].append(dict(id=str(chNumber), title=f'Chapter {chNumber}', desc=text(20), scenes=[]))
+        paragraphs = []
+        wordsLeft = wordsPerScene
+        while wordsLeft > 0:
+            paragraphs.append(paragraph(min(wordsLeft, WORDS_PER_PARAGRAPH), len(paragraphs)))
+            wordsLeft -= WORDS_PER_PARAGRAPH
+        data['chapters'][-1]['scenes'].append(dict(
+            id=str(scIndex + 1),
+            title=text(3).title(),
+            desc=text(30),
+            goal=text(10),
+            conflict=text(10),
+            outcome=text(10),
+            tags=[text(1), text(1)],
+            paragraphs=paragraphs,
+            characters=[data['characters'][scIndex % len(data['characters'])]['id']],
+            locations=[data['locations'][scIndex % len(data['locations'])]['id']],
+            items=[data['items'][scIndex % len(data['items'])]['id']],
+            ))
+    return data
+
+
+def get_scenes(data):
+    """Return a list of all scenes in the order of the chapters."""
+    scenes = []
+    for chapter in data['chapters']:
+        scenes.extend(chapter['scenes'])
+    return scenes
+
+
+def to_yw(paragraphs):
+    """Return scene paragraphs as yWriter scene content."""
+    language = f'{LANGUAGE[0]}-{LANGUAGE[1]}'
+    lines = []
+    for segments in paragraphs:
+        line = []
+        for textFormat, text in segments:
+            if textFormat == 'i':
+                line.append(f'[i]{text}[/i]')
+            elif textFormat == 'lang':
+                line.append(f'[lang={language}]{text}[/lang={language}]')
+            else:
+                line.append(text)
+        lines.append(''.join(line))
+    return '\n'.join(lines)
+
+
+def to_odt(segments):
+    """Return a scene paragraph as ODT paragraph."""
+    body = []
+    for textFormat, text in segments:
+        if textFormat == 'i':
+            body.append(f'<text:span text:style-name="Emphasis">{escape(text)}</text:span>')
+        elif textFormat == 'lang':
+            body.append(f'<text:span text:style-name="T1">{escape(text)}</text:span>')
+        else:
+            body.append(escape(text))
+    return f'<text:p text:style-name="Text_20_body">{"".join(body)}</text:p>'
+
+
+def write_project(filePath, data):
+    """Write a yWriter project with pywriter's Yw7File class."""
+    novel = Novel()
+    novel.title = 'Benchmark'
+    novel.authorName = 'oo2yw7'
+    novel.languageCode = 'en'
+    novel.countryCode = 'US'
+    for elementType, srtName, elementClass in (
+            ('characters', 'srtCharacters', Character),
+            ('locations', 'srtLocations', WorldElement),
+            ('items', 'srtItems', WorldElement),
+            ):
+        elements = getattr(novel, elementType)
+        sortOrder = getattr(novel, srtName)
+        for elementData in data[elementType]:
+            element = elementClass()
+            for attribute in elementData:
+                if attribute != 'id':
+                    setattr(element, attribute, elementData[attribute])
+            elements[elementData['id']] = element
+            sortOrder.append(elementData['id'])
+    for chapterData in data['chapters']:
+        chapter = Chapter()
+        chapter.title = chapterData['title']
+        chapter.desc = chapterData['desc']
+        chapter.chLevel = 0
+        chapter.chType = 0
+        chapter.srtScenes = []
+        for sceneData in chapterData['scenes']:
+            scene = Scene()
+            scene.title = sceneData['title']
+            scene.desc = sceneData['desc']
+            scene.goal = sceneData['goal']
+            scene.conflict = sceneData['conflict']
+            scene.outcome = sceneData['outcome']
+            scene.tags = sceneData['tags']
+            scene.characters = sceneData['characters']
+            scene.locations = sceneData['locations']
+            scene.items = sceneData['items']
+            scene.sceneContent = to_yw(sceneData['paragraphs'])
+            scene.status = Scene.STATUS.index('Draft')
+            scene.scType = 0
+            novel.scenes[sceneData['id']] = scene
+            chapter.srtScenes.append(sceneData['id'])
+        novel.chapters[chapterData['id']] = chapter
+        novel.srtChapters.append(chapterData['id'])
+    ywFile = Yw7File(filePath)
+    ywFile.novel = novel
+    ywFile.write()
+
+
+def write_odt(filePath, body):
+    """Write an ODT document with the given body."""
+    content = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {ODF_NAMESPACES}>'
+               f'{ODT_AUTOMATIC_STYLES}<office:body><office:text>{"".join(body)}</office:text></office:body>'
+               '</office:document-content>')
+    styles = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-styles {ODF_NAMESPACES}><office:styles>'
+              '<style:default-style style:family="paragraph"><style:text-properties fo:language="en" fo:country="US"/>'
+              '</style:default-style></office:styles></office:document-styles>')
+    with zipfile.ZipFile(filePath, 'w', compression=zipfile.ZIP_DEFLATED) as odfFile:
+        odfFile.writestr('mimetype', 'application/vnd.oasis.opendocument.text')
+        odfFile.writestr('content.xml', content)
+        odfFile.writestr('styles.xml', styles)
+
+
+def write_ods(filePath, rows, columns):
+    """Write an ODS document with a table of the given rows.
+
+    Fill up each row with empty cells to the given number of columns.
+    """
+    table = []
+    for row in rows:
+        cells = []
+        for value in row:
+            cells.append(f'<table:table-cell office:value-type="string"><text:p>{escape(value)}</text:p></table:table-cell>')
+        if len(row) < columns:
+            cells.append(f'<table:table-cell table:number-columns-repeated="{columns - len(row)}"/>')
+        table.append(f'<table:table-row>{"".join(cells)}</table:table-row>')
+    content = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {ODF_NAMESPACES}>'
+               '<office:body><office:spreadsheet><table:table table:name="Benchmark">'
+               f'{"".join(table)}</table:table></office:spreadsheet></office:body></office:document-content>')
+    with zipfile.ZipFile(filePath, 'w', compression=zipfile.ZIP_DEFLATED) as odfFile:
+        odfFile.writestr('mimetype', 'application/vnd.oasis.opendocument.spreadsheet')
+        odfFile.writestr('content.xml', content)
+
+
+def write_manuscript(filePath, data):
+    """Write an editable manuscript with chapter and scene sections."""
+    body = []
+    for chapter in data['chapters']:
+        body.append(f'<text:section text:name="ChID:{chapter["id"]}">')
+        body.append(f'<text:h text:style-name="Heading_20_2" text:outline-level="2">{escape(chapter["title"])}</text:h>')
+        for scene in chapter['scenes']:
+            body.append(f'<text:section text:name="ScID:{scene["id"]}">')
+            for paragraph in scene['paragraphs']:
+                body.append(to_odt(paragraph))
+            body.append('</text:section>')
+        body.append('</text:section>')
+    write_odt(filePath, body)
+
+
+def write_proof(filePath, data):
+    """Write a tagged manuscript with chapter and scene markers."""
+    body = []
+    for chapter in data['chapters']:
+        body.append(f'<text:p text:style-name="yWriter_20_mark">[ChID:{chapter["id"]} (Chapter)]</text:p>')
+        body.append(f'<text:h text:style-name="Heading_20_2" text:outline-level="2">{escape(chapter["title"])}</text:h>')
+        for scene in chapter['scenes']:
+            body.append(f'<text:p text:style-name="yWriter_20_mark">[ScID:{scene["id"]} (Normal)]</text:p>')
+            for paragraph in scene['paragraphs']:
+                body.append(to_odt(paragraph))
+            body.append('<text:p text:style-name="yWriter_20_mark">[/ScID]</text:p>')
+        body.append('<text:p text:style-name="yWriter_20_mark">[/ChID]</text:p>')
+    write_odt(filePath, body)
+
+
+def write_scene_descriptions(filePath, data):
+    """Write scene descriptions with chapter and scene sections."""
+    body = []
+    for chapter in data['chapters']:
+        body.append(f'<text:section text:name="ChID:{chapter["id"]}">')
+        body.append(f'<text:h text:style-name="Heading_20_2" text:outline-level="2">{escape(chapter["title"])}</text:h>')
+        for scene in chapter['scenes']:
+            body.append(f'<text:section text:name="ScID:{scene["id"]}">')
+            body.append(f'<text:p text:style-name="Text_20_body">{escape(scene["desc"])}</text:p>')
+            body.append('</text:section>')
+        body.append('</text:section>')
+    write_odt(filePath, body)
+
+
+def write_outline(filePath, data):
+    """Write a novel outline with chapter headings, scene headings, and descriptions."""
+    body = []
+    for chapter in data['chapters']:
+        body.append(f'<text:h text:style-name="Heading_20_2" text:outline-level="2">{escape(chapter["title"])}</text:h>')
+        body.append(f'<text:p text:style-name="Text_20_body">{escape(chapter["desc"])}</text:p>')
+        for scene in chapter['scenes']:
+            body.append(f'<text:h text:style-name="Heading_20_3" text:outline-level="3">{escape(scene["title"])}</text:h>')
+            body.append(f'<text:p text:style-name="Text_20_body">{escape(scene["desc"])}</text:p>')
+    write_odt(filePath, body)
+
+
+def write_scene_list(filePath, data):
+    """Write a scene list with a title row and a row per scene."""
+    rows = [['Scene link', 'Scene title', 'Scene description', 'Tags', 'Scene notes', 'A/R',
+             'Goal', 'Conflict', 'Outcome', 'Scene', 'Words total',
+             'Field 1', 'Field 2', 'Field 3', 'Field 4',
+             'Word count', 'Letter count', 'Status', 'Characters', 'Locations', 'Items']]
+    for i, scene in enumerate(get_scenes(data)):
+        rows.append([f'ScID:{scene["id"]}', scene['title'], scene['desc'], ';'.join(scene['tags']), '', 'A',
+                     scene['goal'], scene['conflict'], scene['outcome'], str(i + 1), '0',
+                     '2', '3', '4', '5',
+                     '0', '0', 'Draft'])
+    write_ods(filePath, rows, SCENE_LIST_COLUMNS)
+
+
+def write_character_list(filePath, data):
+    """Write a character list with a title row and a row per character."""
+    rows = [['ID', 'Name', 'Full name', 'Aka', 'Description', 'Bio', 'Goals', 'Importance', 'Tags', 'Notes']]
+    for character in data['characters']:
+        rows.append([f'CrID:{character["id"]}', character['title'], character['fullName'], '',
+                     character['desc'], character['bio'], character['goals'],
+                     Character.MAJOR_MARKER if character['isMajor'] else Character.MINOR_MARKER])
+    write_ods(filePath, rows, CHARACTER_LIST_COLUMNS)
+
+
+def write_element_list(filePath, elements, prefix):
+    """Write a location or item list with a title row and a row per element."""
+    rows = [['ID', 'Name', 'Description', 'Aka', 'Tags']]
+    for element in elements:
+        rows.append([f'{prefix}:{element["id"]}', element['title'], element['desc'], element['aka']])
+    write_ods(filePath, rows, ELEMENT_LIST_COLUMNS)
+
+
+def generate(dirPath, words, scenes):
+    """Write the project and its documents to a directory.
+
+    Positional arguments:
+        dirPath -- str: path of an existing directory.
+        words -- int: total number of words in the scenes.
+        scenes -- int: number of scenes.
+
+    Return a dictionary: key = document type, value = document path.
+    The project file path has the key "project".
+    """
+    projectData = make_novel_data(words, scenes, 0)
+    documentData = make_novel_data(words, scenes, 1)
+    paths = dict(
+        project=f'{dirPath}/bench.yw7',
+        manuscript=f'{dirPath}/bench_manuscript.odt',
+        proof=f'{dirPath}/bench_proof.odt',
+        scenes=f'{dirPath}/bench_scenes.odt',
+        scenelist=f'{dirPath}/bench_scenelist.ods',
+        charlist=f'{dirPath}/bench_charlist.ods',
+        loclist=f'{dirPath}/bench_loclist.ods',
+        itemlist=f'{dirPath}/bench_itemlist.ods',
+        outline=f'{dirPath}/outline.odt',
+        )
+    write_project(paths['project'], projectData)
+    write_manuscript(paths['manuscript'], documentData)
+    write_proof(paths['proof'], documentData)
+    write_scene_descriptions(paths['scenes'], documentData)
+    write_scene_list(paths['scenelist'], documentData)
+    write_character_list(paths['charlist'], documentData)
+    write_element_list(paths['loclist'], documentData['locations'], 'LcID')
+    write_element_list(paths['itemlist'], documentData['items'], 'ItID')
+    write_outline(paths['outline'], documentData)
+    return paths
+
+
+if __name__ == '__main__':
+    try:
+        dirPath = sys.argv[1]
+    except:
+        print(__doc__)
+        sys.exit(1)
+    try:
+        words = int(sys.argv[2])
+    except:
+        words = 100000
+    try:
+        scenes = int(sys.argv[3])
+    except:
+        scenes = 500
+    os.makedirs(dirPath, exist_ok=True)
+    for documentType, filePath in generate(dirPath, words, scenes).items():
+        print(f'{documentType:<12}{os.path.getsize(filePath):>12} bytes  {filePath}')
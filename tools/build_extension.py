@@ -1,7 +1,7 @@
 """Build a Python script for the OpenOffice "convert yWriter" script.
         
 In order to distribute single scripts without dependencies, 
-this script "inlines" all modules imported from the pywriter package.
+this script "inlines" all modules imported from the oo2yw7lib and pywriter packages.
 
 Copyright (c) 2023 Peter Triesberger
 For further information see https://github.com/peter88213/PyWriter
@@ -16,10 +16,26 @@ SRC = '../src/'
 BUILD = '../test/'
 SOURCE_FILE = f'{SRC}oo2yw7_.py'
 TARGET_FILE = f'{BUILD}oo2yw7.py'
+BATCH_SOURCE_FILE = f'{SRC}oo2yw7_batch_.py'
+BATCH_TARGET_FILE = f'{BUILD}oo2yw7_batch.py'
+CLIENT_SOURCE_FILE = f'{SRC}oo2yw7_client_.py'
+CLIENT_TARGET_FILE = f'{BUILD}oo2yw7_client.py'
+SERVER_SOURCE_FILE = f'{SRC}oo2yw7_server_.py'
+SERVER_TARGET_FILE = f'{BUILD}oo2yw7_server.py'
+
+
+def build(sourceFile, targetFile):
+    tempFile = f'{targetFile}.tmp'
+    inliner.run(sourceFile, tempFile, 'oo2yw7lib', SRC)
+    inliner.run(tempFile, targetFile, 'pywriter', '../../PyWriter/src/')
+    os.remove(tempFile)
 
 
 def main():
-    inliner.run(SOURCE_FILE, TARGET_FILE, 'pywriter', '../../PyWriter/src/')
+    build(SOURCE_FILE, TARGET_FILE)
+    build(BATCH_SOURCE_FILE, BATCH_TARGET_FILE)
+    build(CLIENT_SOURCE_FILE, CLIENT_TARGET_FILE)
+    build(SERVER_SOURCE_FILE, SERVER_TARGET_FILE)
     print('Done.')
 
 
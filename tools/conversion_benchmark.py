@@ -0,0 +1,145 @@
+"""Measure the oo2yw7 conversions phase by phase and write the results in JSON format.
+
+Usage:
+conversion_benchmark.py [-h] [--size WORDS SCENES] [--repeat N] [--no-memory] [--output FILE]
+
+For each size, generate a synthetic project with documents (see benchmark_corpus.py),
+then import each document into a fresh copy of the project,
+and create a new project from the outline.
+Each conversion is repeated, and the fastest run is reported
+with wall time and peak memory of its phases.
+
+Peak memory is traced with tracemalloc, so the times include the tracing overhead.
+Use --no-memory for pure timing.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+from time import perf_counter
+sys.path.insert(0, f'{os.getcwd()}/../../PyWriter/src')
+sys.path.insert(0, f'{os.getcwd()}/../src')
+from oo2yw7lib.converter.batch_importer import BatchImporter
+from oo2yw7lib.converter.import_cache import ImportCache
+from oo2yw7lib.converter.phase_recorder import PhaseRecorder
+from benchmark_corpus import generate
+
+DEFAULT_SIZES = [(1000, 10), (100000, 500)]
+IMPORT_DOCUMENTS = ('manuscript', 'proof', 'scenes', 'scenelist', 'charlist', 'loclist', 'itemlist')
+NEW_PROJECT_DOCUMENTS = ('outline',)
+
+
+def remove_files(*filePaths):
+    """Remove files, if they exist."""
+    for filePath in filePaths:
+        if os.path.isfile(filePath):
+            os.remove(filePath)
+
+
+def convert(sourcePath, traceMemory):
+    """Convert a document and return the result dictionary."""
+    converter = BatchImporter()
+    converter.phaseTimer = PhaseRecorder(traceMemory=traceMemory)
+    startTime = perf_counter()
+    success, message, __ = converter.convert(sourcePath)
+    elapsed = perf_counter() - startTime
+    return dict(
+        success=success,
+        message=message,
+        time=elapsed,
+        updated=converter.updatedElements,
+        phases=converter.phaseTimer.phases,
+        )
+
+
+def run_size(words, scenes, repeat, traceMemory):
+    """Generate a corpus of the given size and return the results of its conversions."""
+    results = []
+    with tempfile.TemporaryDirectory() as tempDir:
+        paths = generate(tempDir, words, scenes)
+        projectPath = paths['project']
+        originalPath = f'{projectPath}.orig'
+        shutil.copyfile(projectPath, originalPath)
+        for documentType in IMPORT_DOCUMENTS + NEW_PROJECT_DOCUMENTS:
+            sourcePath = paths[documentType]
+            if documentType in NEW_PROJECT_DOCUMENTS:
+                targetPath = f'{os.path.splitext(sourcePath)[0]}.yw7'
+            else:
+                targetPath = projectPath
+            best = None
+            for __ in range(repeat):
+                remove_files(targetPath, f'{targetPath}{ImportCache.EXTENSION}', f'{targetPath}.bak')
+                if targetPath == projectPath:
+                    shutil.copyfile(originalPath, projectPath)
+                result = convert(sourcePath, traceMemory)
+                if best is None or result['time'] < best['time']:
+                    best = result
+            best.update(
+                document=documentType,
+                words=words,
+                scenes=scenes,
+                size=os.path.getsize(sourcePath),
+                )
+            results.append(best)
+            print(f'{words:>8} words {scenes:>5} scenes  {documentType:<12}{best["time"]:>8.3f} s  {best["message"]}',
+                  file=sys.stderr)
+    return results
+
+
+def main(sizes, repeat=3, traceMemory=True):
+    """Run the benchmark and return the report as a dictionary.
+
+    Positional arguments:
+        sizes -- list of (words, scenes) tuples.
+
+    Optional arguments:
+        repeat -- int: number of runs per conversion.
+        traceMemory -- bool: if True, trace the peak memory of each phase.
+    """
+    report = dict(
+        python=platform.python_version(),
+        platform=platform.platform(),
+        repeat=repeat,
+        traceMemory=traceMemory,
+        results=[],
+        )
+    for words, scenes in sizes:
+        report['results'].extend(run_size(words, scenes, repeat, traceMemory))
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure the oo2yw7 conversions phase by phase.',
+        epilog='The results are written in JSON format. Times are in seconds, peak memory in bytes.')
+    parser.add_argument('-s', '--size',
+                        type=int,
+                        nargs=2,
+                        action='append',
+                        metavar=('WORDS', 'SCENES'),
+                        help='corpus size; can be given more than once (default: 1000 10 and 100000 500).')
+    parser.add_argument('-n', '--repeat',
+                        type=int,
+                        default=3,
+                        help='number of runs per conversion (default: 3).')
+    parser.add_argument('--no-memory',
+                        action='store_true',
+                        help='do not trace the peak memory.')
+    parser.add_argument('-o', '--output',
+                        default=None,
+                        help='write the results to a file instead of stdout.')
+    args = parser.parse_args()
+    report = main(args.size or DEFAULT_SIZES, repeat=max(1, args.repeat), traceMemory=not args.no_memory)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
@@ -8,17 +8,21 @@ import sys
 sys.path.insert(0, f'{os.getcwd()}/../../PyWriter/src')
 from build_extension import main
 from build_extension import TARGET_FILE
+from build_extension import BATCH_TARGET_FILE
+from build_extension import CLIENT_TARGET_FILE
+from build_extension import SERVER_TARGET_FILE
 import pgettext
 
 APP = 'oo2yw7'
 POT_FILE = '../i18n/messages.pot'
+LIB_PATH = '../src/oo2yw7lib'
 
 
 def make_pot(version='unknown'):
-    # Generate a complete script.
+    # Generate the complete scripts.
     main()
 
-    # Generate a pot file from the script.
+    # Generate a pot file from the scripts.
     if os.path.isfile(POT_FILE):
         os.replace(POT_FILE, f'{POT_FILE}.bak')
         backedUp = True
@@ -26,7 +30,14 @@ def make_pot(version='unknown'):
         backedUp = False
     try:
         pot = pgettext.PotFile(POT_FILE, app=APP, appVersion=version)
-        pot.scan_file(TARGET_FILE)
+        for scriptFile in (TARGET_FILE, BATCH_TARGET_FILE, CLIENT_TARGET_FILE, SERVER_TARGET_FILE):
+            pot.scan_file(scriptFile)
+
+        # Also scan the library modules that are not used by the scripts.
+        for dirPath, __, fileNames in sorted(os.walk(LIB_PATH)):
+            for fileName in sorted(fileNames):
+                if fileName.endswith('.py'):
+                    pot.scan_file(os.path.join(dirPath, fileName))
         print(f'Writing "{pot.filePath}"...\n')
         pot.write_pot()
         return True
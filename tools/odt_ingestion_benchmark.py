@@ -0,0 +1,133 @@
+"""Compare the ODT ingestion of pywriter with the streaming ingestion of oo2yw7.
+
+Usage:
+odt_ingestion_benchmark.py [-h] [words]
+
+Generate a synthetic manuscript with the given number of words (default: 300000),
+then measure time and peak memory of
+- the project type detection for new projects,
+- reading the manuscript into an empty novel.
+
+Memory is traced with tracemalloc, so the times include the tracing overhead.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import random
+import argparse
+import tempfile
+import tracemalloc
+import zipfile
+from time import perf_counter
+sys.path.insert(0, f'{os.getcwd()}/../../PyWriter/src')
+sys.path.insert(0, f'{os.getcwd()}/../src')
+from pywriter.model.novel import Novel
+from pywriter.converter.new_project_factory import NewProjectFactory
+from pywriter.odt_r.odt_r_manuscript import OdtRManuscript
+from oo2yw7lib.converter.stream_project_factory import StreamProjectFactory
+from oo2yw7lib.odt_r.odt_stream_readers import StreamOdtRManuscript
+
+WORDS_PER_PARAGRAPH = 100
+PARAGRAPHS_PER_SCENE = 20
+SCENES_PER_CHAPTER = 5
+ODF_NAMESPACES = ('xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+                  'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+                  'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+                  'xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0" '
+                  'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+                  'xmlns:meta="urn:oasis:names:tc:opendocument:xmlns:meta:1.0"')
+
+
+def write_manuscript(filePath, words):
+    """Write a manuscript ODT document with the given number of words.
+    
+    The chapter sections have no headings, because the chapters are unknown to the empty novel.
+    """
+    vocabulary = ['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit',
+                  'sed', 'do', 'eiusmod', 'tempor', 'incididunt', 'ut', 'labore', 'et', 'dolore']
+    randomizer = random.Random(0)
+
+    def paragraph():
+        text = ' '.join(randomizer.choices(vocabulary, k=WORDS_PER_PARAGRAPH - 1))
+        return (f'<text:p text:style-name="Text_20_body">{text} '
+                '<text:span text:style-name="Emphasis">ipsum</text:span></text:p>')
+
+    body = []
+    scId = 0
+    chId = 0
+    paragraphs = max(1, words // WORDS_PER_PARAGRAPH)
+    while paragraphs > 0:
+        chId += 1
+        body.append(f'<text:section text:name="ChID:{chId}">')
+        for __ in range(SCENES_PER_CHAPTER):
+            if paragraphs <= 0:
+                break
+
+            scId += 1
+            body.append(f'<text:section text:name="ScID:{scId}">')
+            for __ in range(min(paragraphs, PARAGRAPHS_PER_SCENE)):
+                body.append(paragraph())
+            paragraphs -= PARAGRAPHS_PER_SCENE
+            body.append('</text:section>')
+        body.append('</text:section>')
+    content = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {ODF_NAMESPACES}>'
+               f'<office:body><office:text>{"".join(body)}</office:text></office:body></office:document-content>')
+    styles = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-styles {ODF_NAMESPACES}><office:styles>'
+              '<style:default-style style:family="paragraph"><style:text-properties fo:language="en" fo:country="US"/>'
+              '</style:default-style></office:styles></office:document-styles>')
+    with zipfile.ZipFile(filePath, 'w', compression=zipfile.ZIP_DEFLATED) as odfFile:
+        odfFile.writestr('mimetype', 'application/vnd.oasis.opendocument.text')
+        odfFile.writestr('content.xml', content)
+        odfFile.writestr('styles.xml', styles)
+
+
+def measure(function):
+    """Return elapsed time in seconds and peak traced memory in bytes."""
+    tracemalloc.start()
+    startTime = perf_counter()
+    function()
+    elapsed = perf_counter() - startTime
+    __, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def read_manuscript(readerClass, filePath):
+    """Read a manuscript into an empty novel."""
+    reader = readerClass(filePath)
+    reader.novel = Novel()
+    reader.read()
+
+
+def main(words):
+    with tempfile.TemporaryDirectory() as tempDir:
+        manuscript = f'{tempDir}/bench_manuscript.odt'
+        newDocument = f'{tempDir}/bench.odt'
+        write_manuscript(manuscript, words)
+        write_manuscript(newDocument, words)
+        print(f'{words} words, {os.path.getsize(manuscript)} bytes zipped.')
+        print(f'{"Task":<40}{"Time/s":>10}{"Peak/MiB":>12}')
+        tasks = [
+            ('New project detection (pywriter)', lambda: NewProjectFactory().make_file_objects(newDocument, suffix=None)),
+            ('New project detection (streaming)', lambda: StreamProjectFactory().make_file_objects(newDocument, suffix=None)),
+            ('Manuscript reading (pywriter)', lambda: read_manuscript(OdtRManuscript, manuscript)),
+            ('Manuscript reading (streaming)', lambda: read_manuscript(StreamOdtRManuscript, manuscript)),
+            ]
+        for title, task in tasks:
+            elapsed, peak = measure(task)
+            print(f'{title:<40}{elapsed:>10.3f}{peak / 0x100000:>12.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare the ODT ingestion of pywriter with the streaming ingestion of oo2yw7.')
+    parser.add_argument('words',
+                        type=int,
+                        nargs='?',
+                        default=300000,
+                        help='number of words of the synthetic manuscript (default: 300000).')
+    args = parser.parse_args()
+    main(args.words)
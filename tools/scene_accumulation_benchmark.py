@@ -0,0 +1,77 @@
+"""Compare the scene text accumulation of pywriter with the one of oo2yw7.
+
+Usage:
+scene_accumulation_benchmark.py [-h] [paragraphs]
+
+Generate a "work in progress" document with a single chapter
+and a single scene of the given number of paragraphs (default: 10000),
+then measure the time needed for reading it.
+
+Copyright (c) 2023 Peter Triesberger
+For further information see https://github.com/peter88213/oo2yw7
+Published under the MIT License (https://opensource.org/licenses/mit-license.php)
+"""
+import os
+import sys
+import argparse
+import tempfile
+import zipfile
+from time import perf_counter
+sys.path.insert(0, f'{os.getcwd()}/../../PyWriter/src')
+sys.path.insert(0, f'{os.getcwd()}/../src')
+from pywriter.model.novel import Novel
+from pywriter.odt_r.odt_r_import import OdtRImport
+from oo2yw7lib.odt_r.odt_stream_r_import import StreamOdtRImport
+from odt_ingestion_benchmark import ODF_NAMESPACES
+
+
+def write_document(filePath, paragraphs):
+    """Write an ODT document with one chapter and one scene."""
+    body = ['<text:h text:style-name="Heading_20_2" text:outline-level="2">Chapter</text:h>']
+    for i in range(paragraphs):
+        body.append(f'<text:p text:style-name="Text_20_body">Paragraph {i} with a handful of words, '
+                    '<text:span text:style-name="Emphasis">some</text:span> in italics.</text:p>')
+    content = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-content {ODF_NAMESPACES}>'
+               f'<office:body><office:text>{"".join(body)}</office:text></office:body></office:document-content>')
+    styles = (f'<?xml version="1.0" encoding="UTF-8"?><office:document-styles {ODF_NAMESPACES}>'
+              '<office:styles/></office:document-styles>')
+    with zipfile.ZipFile(filePath, 'w', compression=zipfile.ZIP_DEFLATED) as odfFile:
+        odfFile.writestr('mimetype', 'application/vnd.oasis.opendocument.text')
+        odfFile.writestr('content.xml', content)
+        odfFile.writestr('styles.xml', styles)
+
+
+def read_document(readerClass, filePath):
+    """Read the document into an empty novel and return the elapsed time and the novel."""
+    reader = readerClass(filePath)
+    reader.novel = Novel()
+    startTime = perf_counter()
+    reader.read()
+    return perf_counter() - startTime, reader.novel
+
+
+def main(paragraphs):
+    with tempfile.TemporaryDirectory() as tempDir:
+        document = f'{tempDir}/bench.odt'
+        write_document(document, paragraphs)
+        print(f'One scene with {paragraphs} paragraphs.')
+        results = []
+        for title, readerClass in (('pywriter', OdtRImport), ('oo2yw7', StreamOdtRImport)):
+            elapsed, novel = read_document(readerClass, document)
+            scene = novel.scenes['1']
+            results.append((scene.sceneContent, scene.wordCount, scene.letterCount, scene.status))
+            print(f'{title:<10}{elapsed:>10.3f} s')
+        if results[0] != results[1]:
+            print('WARNING: The results differ.')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare the scene text accumulation of pywriter with the one of oo2yw7.')
+    parser.add_argument('paragraphs',
+                        type=int,
+                        nargs='?',
+                        default=10000,
+                        help='number of paragraphs of the scene (default: 10000).')
+    args = parser.parse_args()
+    main(args.paragraphs)